@@ -9,6 +9,7 @@ import numpy as np
 import soundfile as sf
 from typing import Dict, List, Tuple, Any, Optional
 from dataclasses import dataclass
+from numpy.lib.stride_tricks import sliding_window_view
 import tempfile
 import os
 
@@ -59,10 +60,13 @@ class CrossfadeGenerator:
         if length == 0:
             return np.array([]), np.array([])
         
-        # Generate raised cosine (Hann-like) window
-        t = np.linspace(0, np.pi, length)
-        fade_out = np.cos(t * 0.5) ** 2  # Fade out: 1 -> 0
-        fade_in = np.sin(t * 0.5) ** 2   # Fade in: 0 -> 1
+        # Generate raised cosine (Hann-like) window in place using
+        # cos^2(t/2) = (1 + cos t) / 2 and sin^2(t/2) = 1 - cos^2(t/2)
+        fade_out = np.linspace(0, np.pi, length, dtype=np.float32)
+        np.cos(fade_out, out=fade_out)
+        fade_out += 1.0
+        fade_out *= 0.5             # Fade out: 1 -> 0
+        fade_in = 1.0 - fade_out    # Fade in: 0 -> 1
         
         return fade_out, fade_in
     
@@ -77,34 +81,45 @@ class CrossfadeGenerator:
         if length == 0:
             return np.array([]), np.array([])
         
-        fade_out = np.linspace(1.0, 0.0, length)
-        fade_in = np.linspace(0.0, 1.0, length)
+        fade_out = np.linspace(1.0, 0.0, length, dtype=np.float32)
+        fade_in = np.linspace(0.0, 1.0, length, dtype=np.float32)
         
         return fade_out, fade_in
 
 
+def blend_gain_clip(original: np.ndarray, processed: np.ndarray, blend_ratio: float,
+                    gain_linear: float, out: np.ndarray) -> np.ndarray:
+    """
+    Blend two frames, apply gain and clip to [-1, 1] without temporaries.
+    
+    Computes ``clip(((1 - blend) * original + blend * processed) * gain)``
+    as ``original + blend * (processed - original)`` so every step can run
+    in place on ``out``.
+    
+    Returns:
+        The ``out`` buffer
+    """
+    np.subtract(processed, original, out=out)
+    out *= blend_ratio
+    out += original
+    if gain_linear != 1.0:
+        out *= gain_linear
+    np.clip(out, -1.0, 1.0, out=out)
+    return out
+
+
 class AudioFrameSegmenter:
     """Handles segmentation of audio into overlapping frames."""
     
     def __init__(self, config: FrameConfig):
         self.config = config
+        self._crossfade_windows = None
     
-    def segment_audio(self, audio: np.ndarray) -> List[Tuple[np.ndarray, FrameInfo]]:
-        """
-        Segment audio into overlapping frames.
-        
-        Args:
-            audio: Input audio array (mono or stereo)
-            
-        Returns:
-            List of (frame_data, frame_info) tuples
-        """
-        frames = []
-        audio_length = len(audio)
-        
+    def _frame_infos(self, audio_length: int) -> List[FrameInfo]:
+        """Compute frame boundaries and metadata for audio of the given length."""
         # Handle edge case of very short audio
         if audio_length <= self.config.full_frame_size:
-            frame_info = FrameInfo(
+            return [FrameInfo(
                 index=0,
                 start_sample=0,
                 end_sample=audio_length,
@@ -112,45 +127,90 @@ class AudioFrameSegmenter:
                 needs_crossfade_start=False,
                 needs_crossfade_end=False,
                 is_last_frame=True
+            )]
+        
+        frame_starts = np.arange(0, audio_length, self.config.hop_size)
+        frame_ends = np.minimum(frame_starts + self.config.full_frame_size, audio_length)
+        
+        return [
+            FrameInfo(
+                index=index,
+                start_sample=start,
+                end_sample=end,
+                actual_size=end - start,
+                needs_crossfade_start=start > 0,
+                needs_crossfade_end=end < audio_length,
+                is_last_frame=end >= audio_length
             )
-            return [(audio.copy(), frame_info)]
+            for index, (start, end) in enumerate(zip(frame_starts.tolist(), frame_ends.tolist()))
+        ]
+    
+    def _full_frame_windows(self, audio: np.ndarray) -> np.ndarray:
+        """Strided (frames × samples [× channels]) view over every full-length frame."""
+        windows = sliding_window_view(audio, self.config.full_frame_size, axis=0)
+        windows = windows[::self.config.hop_size]
+        if audio.ndim > 1:
+            # Window axis is appended last; move it back to (samples, channels)
+            windows = np.moveaxis(windows, -1, 1)
+        return windows
+    
+    def segment_audio(self, audio: np.ndarray) -> List[Tuple[np.ndarray, FrameInfo]]:
+        """
+        Segment audio into overlapping frames.
         
-        frame_index = 0
-        current_start = 0
+        Frames are zero-copy views into ``audio`` and must be treated as
+        read-only; processing stages write their results to new buffers.
         
-        while current_start < audio_length:
-            # Calculate frame boundaries
-            frame_end = min(current_start + self.config.full_frame_size, audio_length)
-            actual_frame_size = frame_end - current_start
-            
-            # Extract frame data
-            if audio.ndim == 1:
-                frame_data = audio[current_start:frame_end].copy()
-            else:
-                frame_data = audio[current_start:frame_end, :].copy()
-            
-            # Create frame info
-            frame_info = FrameInfo(
-                index=frame_index,
-                start_sample=current_start,
-                end_sample=frame_end,
-                actual_size=actual_frame_size,
-                needs_crossfade_start=current_start > 0,
-                needs_crossfade_end=frame_end < audio_length,
-                is_last_frame=frame_end >= audio_length
-            )
-            
-            frames.append((frame_data, frame_info))
-            
-            # Move to next frame position
-            current_start += self.config.hop_size
-            frame_index += 1
+        Args:
+            audio: Input audio array (mono or stereo)
             
-            # Break if we're past the end
-            if current_start >= audio_length:
-                break
+        Returns:
+            List of (frame_data, frame_info) tuples
+        """
+        frame_infos = self._frame_infos(len(audio))
+        if len(audio) <= self.config.full_frame_size:
+            return [(audio, frame_infos[0])]
+        
+        windows = self._full_frame_windows(audio)
+        
+        # Trailing frames shorter than a full frame are plain slices
+        return [
+            (windows[info.index] if info.index < len(windows)
+             else audio[info.start_sample:info.end_sample], info)
+            for info in frame_infos
+        ]
+    
+    def segment_audio_block(self, audio: np.ndarray) -> Tuple[np.ndarray, List[FrameInfo]]:
+        """
+        Segment audio into a single contiguous block of frames.
         
-        return frames
+        Unlike ``segment_audio``, frames are materialized with one allocation
+        and one strided copy, giving writable frames for in-place processing.
+        Frames shorter than ``full_frame_size`` are zero-padded.
+        
+        Args:
+            audio: Input audio array (mono or stereo)
+            
+        Returns:
+            Tuple of (frames block of shape (num_frames, full_frame_size[, channels]),
+            list of frame infos)
+        """
+        frame_infos = self._frame_infos(len(audio))
+        frames_block = np.zeros(
+            (len(frame_infos), self.config.full_frame_size) + audio.shape[1:],
+            dtype=audio.dtype
+        )
+        
+        num_full_frames = 0
+        if len(audio) >= self.config.full_frame_size:
+            windows = self._full_frame_windows(audio)
+            num_full_frames = len(windows)
+            frames_block[:num_full_frames] = windows
+        
+        for info in frame_infos[num_full_frames:]:
+            frames_block[info.index, :info.actual_size] = audio[info.start_sample:info.end_sample]
+        
+        return frames_block, frame_infos
     
     def reconstruct_audio(self, processed_frames: List[Tuple[np.ndarray, FrameInfo]], 
                          original_length: int) -> np.ndarray:
@@ -170,54 +230,67 @@ class AudioFrameSegmenter:
         # Determine output shape
         first_frame, _ = processed_frames[0]
         if first_frame.ndim == 1:
-            output = np.zeros(original_length)
+            output = np.zeros(original_length, dtype=first_frame.dtype)
         else:
-            output = np.zeros((original_length, first_frame.shape[1]))
+            output = np.zeros((original_length, first_frame.shape[1]), dtype=first_frame.dtype)
         
         # Overlap-add reconstruction with crossfading
-        for i, (frame_data, frame_info) in enumerate(processed_frames):
-            start_pos = frame_info.start_sample
-            end_pos = min(start_pos + len(frame_data), original_length)
-            
-            if end_pos <= start_pos:
-                continue
-            
-            # Trim frame data if it extends beyond output
-            if len(frame_data) > (end_pos - start_pos):
-                if frame_data.ndim == 1:
-                    frame_data = frame_data[:end_pos - start_pos]
-                else:
-                    frame_data = frame_data[:end_pos - start_pos, :]
-            
-            # Apply crossfading if needed
-            if self.config.overlap_size > 0 and not frame_info.is_last_frame:
-                frame_data = self._apply_crossfade(frame_data, frame_info, processed_frames, i)
-            
-            # Add to output
-            if output.ndim == 1:
-                output[start_pos:end_pos] += frame_data
-            else:
-                output[start_pos:end_pos, :] += frame_data
+        for frame_data, frame_info in processed_frames:
+            self.overlap_add_frame(output, frame_data, frame_info)
         
         return output
     
-    def _apply_crossfade(self, frame_data: np.ndarray, frame_info: FrameInfo,
-                        all_frames: List[Tuple[np.ndarray, FrameInfo]], 
-                        current_index: int) -> np.ndarray:
+    def overlap_add_frame(self, output: np.ndarray, frame_data: np.ndarray,
+                          frame_info: FrameInfo) -> None:
+        """
+        Crossfade a single processed frame and add it into ``output``.
+        
+        Writable frames are crossfaded in place, so callers can stream
+        frames from a reused scratch buffer.
+        """
+        start_pos = frame_info.start_sample
+        end_pos = min(start_pos + len(frame_data), len(output))
+        
+        if end_pos <= start_pos:
+            return
+        
+        # Trim frame data if it extends beyond output
+        if len(frame_data) > (end_pos - start_pos):
+            if frame_data.ndim == 1:
+                frame_data = frame_data[:end_pos - start_pos]
+            else:
+                frame_data = frame_data[:end_pos - start_pos, :]
+        
+        # Apply crossfading if needed
+        if self.config.overlap_size > 0 and not frame_info.is_last_frame:
+            frame_data = self._apply_crossfade(frame_data, frame_info)
+        
+        # Add to output
+        if output.ndim == 1:
+            output[start_pos:end_pos] += frame_data
+        else:
+            output[start_pos:end_pos, :] += frame_data
+    
+    def _apply_crossfade(self, frame_data: np.ndarray, frame_info: FrameInfo) -> np.ndarray:
         """Apply crossfading to overlapping regions."""
         if self.config.crossfade_type == "none" or self.config.overlap_size == 0:
             return frame_data
         
-        # Create crossfade windows
-        if self.config.crossfade_type == "raised_cosine":
-            fade_out, fade_in = CrossfadeGenerator.raised_cosine(self.config.overlap_size)
-        elif self.config.crossfade_type == "linear":
-            fade_out, fade_in = CrossfadeGenerator.linear(self.config.overlap_size)
-        else:
-            return frame_data
+        # Crossfade windows only depend on the config, so build them once
+        if self._crossfade_windows is None:
+            if self.config.crossfade_type == "raised_cosine":
+                self._crossfade_windows = CrossfadeGenerator.raised_cosine(self.config.overlap_size)
+            elif self.config.crossfade_type == "linear":
+                self._crossfade_windows = CrossfadeGenerator.linear(self.config.overlap_size)
+            else:
+                return frame_data
+        fade_out, fade_in = self._crossfade_windows
         
         # Apply fade-out to the end of current frame
         if frame_info.needs_crossfade_end and len(frame_data) >= self.config.overlap_size:
+            # Segmented frames are read-only views into the source audio
+            if not frame_data.flags.writeable:
+                frame_data = frame_data.copy()
             fade_region_start = len(frame_data) - self.config.overlap_size
             if frame_data.ndim == 1:
                 frame_data[fade_region_start:] *= fade_out
@@ -233,6 +306,9 @@ class FrameProcessor:
     def __init__(self, config: FrameConfig):
         self.config = config
         self.segmenter = AudioFrameSegmenter(config)
+        self._scratch = None
+        self._last_gain_db = None
+        self._last_gain_linear = 1.0
     
     def process_audio_with_parameters(self, original_path: str, processed_path: str,
                                     output_path: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
@@ -248,21 +324,22 @@ class FrameProcessor:
         Returns:
             Dict with processing results and metadata
         """
-        # Load audio files
-        original_audio, sample_rate = sf.read(original_path)
-        processed_audio, _ = sf.read(processed_path)
+        # Ensure same length by reading only the common prefix of both files
+        min_length = min(sf.info(original_path).frames, sf.info(processed_path).frames)
         
-        # Ensure same length
-        min_length = min(len(original_audio), len(processed_audio))
-        original_audio = original_audio[:min_length]
-        processed_audio = processed_audio[:min_length]
+        # Load audio files (single precision is plenty for 16/24-bit sources).
+        # These are the only input buffers; frames below are views into them.
+        original_audio, sample_rate = sf.read(original_path, frames=min_length, dtype='float32')
+        processed_audio, _ = sf.read(processed_path, frames=min_length, dtype='float32')
         
         # Segment audio into frames
         original_frames = self.segmenter.segment_audio(original_audio)
         processed_frames = self.segmenter.segment_audio(processed_audio)
         
-        # Process each frame
-        processed_frame_results = []
+        # Process each frame into the reused scratch buffer and overlap-add it
+        # straight into the final audio
+        final_audio = np.zeros(original_audio.shape, dtype=original_audio.dtype)
+        scratch = self._get_scratch(original_audio)
         total_processing_time = 0
         
         for (orig_frame, frame_info), (proc_frame, _) in zip(original_frames, processed_frames):
@@ -270,16 +347,14 @@ class FrameProcessor:
             
             # Apply frame-level processing
             blended_frame = self._process_single_frame(
-                orig_frame, proc_frame, parameters, frame_info
+                orig_frame, proc_frame, parameters, frame_info,
+                out=scratch[:len(orig_frame)]
             )
             
             processing_time = time.time() - start_time
             total_processing_time += processing_time
             
-            processed_frame_results.append((blended_frame, frame_info))
-        
-        # Reconstruct final audio
-        final_audio = self.segmenter.reconstruct_audio(processed_frame_results, min_length)
+            self.segmenter.overlap_add_frame(final_audio, blended_frame, frame_info)
         
         # Apply master processing if needed
         if parameters.get('master_gain_db', 0) != 0 or parameters.get('enable_limiter', False):
@@ -297,55 +372,71 @@ class FrameProcessor:
             'overlap_size': self.config.overlap_size
         }
     
+    def _get_scratch(self, audio: np.ndarray) -> np.ndarray:
+        """Return the frame scratch buffer, (re)allocating it for this audio layout."""
+        shape = (self.config.full_frame_size,) + audio.shape[1:]
+        if self._scratch is None or self._scratch.shape != shape or self._scratch.dtype != audio.dtype:
+            self._scratch = np.empty(shape, dtype=audio.dtype)
+        return self._scratch
+    
     def _process_single_frame(self, original_frame: np.ndarray, processed_frame: np.ndarray,
-                            parameters: Dict[str, Any], frame_info: FrameInfo) -> np.ndarray:
+                            parameters: Dict[str, Any], frame_info: FrameInfo,
+                            out: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Process a single frame with given parameters.
         
-        This simulates the channel processing stage.
+        This simulates the channel processing stage. The result is written
+        to ``out`` when given, otherwise to a newly allocated array.
         """
         # Extract parameters
         blend_ratio = parameters.get('blend_ratio', 0.5)
         volume_adjust_db = parameters.get('volume_adjust_db', 0.0)
         mute = parameters.get('mute', False)
         
-        if mute:
-            return np.zeros_like(original_frame)
-        
-        # Apply blending
-        blended = (1.0 - blend_ratio) * original_frame + blend_ratio * processed_frame
+        if out is None:
+            out = np.empty_like(original_frame)
         
-        # Apply volume adjustment
-        if volume_adjust_db != 0:
-            volume_linear = 10 ** (volume_adjust_db / 20.0)
-            blended *= volume_linear
+        if mute:
+            out.fill(0.0)
+            return out
         
-        # Prevent clipping
-        blended = np.clip(blended, -1.0, 1.0)
+        volume_linear = self._db_to_linear(volume_adjust_db) if volume_adjust_db != 0 else 1.0
         
-        return blended
+        # Blend, apply volume and prevent clipping in a single output buffer
+        return blend_gain_clip(original_frame, processed_frame, blend_ratio, volume_linear, out)
     
     def _apply_master_processing(self, audio: np.ndarray, parameters: Dict[str, Any], 
                                sample_rate: int) -> np.ndarray:
         """
         Apply master gain and limiting to final audio.
         
+        The audio buffer is modified in place and returned.
+        
         Note: This is a simplified version. Real implementation would need
         to handle limiter state across frames properly.
         """
         # Apply master gain
         master_gain_db = parameters.get('master_gain_db', 0.0)
         if master_gain_db != 0:
-            gain_linear = 10 ** (master_gain_db / 20.0)
-            audio *= gain_linear
+            np.multiply(audio, self._db_to_linear(master_gain_db), out=audio)
         
         # Simple limiting (replace with proper frame-aware limiter)
         if parameters.get('enable_limiter', False):
-            # Basic hard limiter as placeholder
-            audio = np.clip(audio, -0.95, 0.95)
+            # Basic hard limiter as placeholder, applied in place. Clean mixes
+            # rarely reach the ceiling, so check the peaks (two reductions,
+            # no temporary) before paying for a full clip pass.
+            if audio.max(initial=0.0) > 0.95 or audio.min(initial=0.0) < -0.95:
+                np.clip(audio, -0.95, 0.95, out=audio)
         
         return audio
     
+    def _db_to_linear(self, gain_db: float) -> float:
+        """Convert dB to linear gain, reusing the last result while unchanged."""
+        if gain_db != self._last_gain_db:
+            self._last_gain_linear = 10 ** (gain_db / 20.0)
+            self._last_gain_db = gain_db
+        return self._last_gain_linear
+    
     def update_parameters_realtime(self, frame_index: int, new_parameters: Dict[str, Any]) -> bool:
         """
         Update processing parameters for real-time use.
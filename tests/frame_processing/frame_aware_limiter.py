@@ -38,14 +38,14 @@ class LimiterConfig:
 @dataclass 
 class LimiterState:
     """Internal state for frame-aware limiter."""
-    # Lookahead and overlap buffers
+    # Lookahead and overlap buffers. The lookahead buffer is preallocated
+    # at full capacity; only its first lookahead_fill samples are valid.
     lookahead_buffer: np.ndarray
+    lookahead_fill: int
     overlap_buffer: np.ndarray
     
-    # Filter states for gain smoothing
-    attack_filter_state: Optional[np.ndarray]
-    hold_filter_state: Optional[np.ndarray] 
-    release_filter_state: Optional[np.ndarray]
+    # Filter state for the cascaded attack/hold/release gain smoothing
+    gain_filter_state: Optional[np.ndarray]
     
     # Gain reduction history
     previous_gain_envelope: np.ndarray
@@ -66,13 +66,21 @@ class LimiterState:
 
 
 class StatefulSlidingWindow:
-    """Stateful implementation of sliding window maximum for peak detection."""
+    """
+    Stateful implementation of sliding window maximum for peak detection.
+    
+    With ``channels`` set, samples are processed as (samples × channels)
+    arrays and the maximum is tracked independently per channel.
     
-    def __init__(self, window_size: int):
+    The maximum is computed with ``scipy.ndimage.maximum_filter1d``; the
+    last ``window_size - 1`` rectified samples are carried over between
+    calls so the envelope continues seamlessly across frames.
+    """
+    
+    def __init__(self, window_size: int, channels: Optional[int] = None):
         self.window_size = window_size
-        self.buffer = np.zeros(window_size)
-        self.position = 0
-        self.filled = False
+        history_shape = (window_size - 1,) if channels is None else (window_size - 1, channels)
+        self.history = np.zeros(history_shape, dtype=np.float32)
     
     def process(self, new_samples: np.ndarray) -> np.ndarray:
         """
@@ -84,23 +92,14 @@ class StatefulSlidingWindow:
         Returns:
             Array of maximum values for each position
         """
-        output = np.zeros(len(new_samples))
+        extended = np.concatenate([self.history, np.abs(new_samples)])
         
-        for i, sample in enumerate(new_samples):
-            # Add new sample to circular buffer
-            self.buffer[self.position] = abs(sample)
-            self.position = (self.position + 1) % self.window_size
-            
-            if not self.filled and self.position == 0:
-                self.filled = True
-            
-            # Calculate maximum in current window
-            if self.filled:
-                output[i] = np.max(self.buffer)
-            else:
-                # Partial window - only consider filled portion
-                active_length = self.position if self.position > 0 else self.window_size
-                output[i] = np.max(self.buffer[:active_length])
+        # Trailing window: output i covers extended[i - window_size + 1 : i + 1]
+        output = ndimage.maximum_filter1d(
+            extended, self.window_size, axis=0, origin=(self.window_size - 1) // 2
+        )[len(self.history):]
+        
+        self.history = extended[len(extended) - len(self.history):]
         
         return output
 
@@ -116,35 +115,48 @@ class FrameAwareLimiter:
     def __init__(self, config: LimiterConfig):
         self.config = config
         self.state = None
+        self._last_gain_db = None
+        self._last_gain_linear = 1.0
         self._initialize_filters()
         self._calculate_sample_parameters()
     
     def _initialize_filters(self):
         """Initialize filter coefficients for gain smoothing."""
-        # Attack filter (exponential smoothing)
+        self.threshold_linear = 10 ** (self.config.threshold_db / 20.0)
+        
+        # Attack filter (exponential smoothing), as a first-order section
         attack_coeff = self.config.attack_filter_coefficient
         self.attack_alpha = np.exp(attack_coeff / (self.config.sample_rate * self.config.attack_ms / 1000))
+        self.attack_sos = np.array([[1 - self.attack_alpha, 0.0, 0.0, 1.0, -self.attack_alpha, 0.0]])
         
         # Hold filter (Butterworth low-pass)
         hold_freq = self.config.hold_filter_coefficient
         hold_nyquist = self.config.sample_rate / 2
         hold_normalized_freq = min(hold_freq / hold_nyquist, 0.99)
         
-        self.hold_filter_b, self.hold_filter_a = signal.butter(
+        self.hold_sos = signal.butter(
             self.config.hold_filter_order, 
             hold_normalized_freq, 
-            btype='low'
+            btype='low',
+            output='sos'
         )
         
         # Release filter (Butterworth low-pass)
         release_freq = self.config.release_filter_coefficient
         release_normalized_freq = min(release_freq / hold_nyquist, 0.99)
         
-        self.release_filter_b, self.release_filter_a = signal.butter(
+        self.release_sos = signal.butter(
             self.config.release_filter_order,
             release_normalized_freq,
-            btype='low'
+            btype='low',
+            output='sos'
         )
+        
+        # Attack, hold and release are linear stages applied in series, so
+        # cascade their second-order sections and run them in one pass
+        self.gain_sos = np.vstack([
+            self.attack_sos, self.hold_sos, self.release_sos
+        ]).astype(np.float32)
     
     def _calculate_sample_parameters(self):
         """Calculate sample-based parameters from millisecond values."""
@@ -172,21 +184,20 @@ class FrameAwareLimiter:
         channels = 2  # Assume stereo
         
         self.state = LimiterState(
-            lookahead_buffer=np.zeros((self.lookahead_size, channels)),
-            overlap_buffer=np.zeros((self.overlap_size, channels)),
-            attack_filter_state=None,
-            hold_filter_state=None,
-            release_filter_state=None,
-            previous_gain_envelope=np.ones(self.overlap_size),
+            lookahead_buffer=np.zeros(
+                (self.lookahead_size + self.config.frame_size, channels), dtype=np.float32
+            ),
+            lookahead_fill=self.lookahead_size,
+            overlap_buffer=np.zeros((self.overlap_size, channels), dtype=np.float32),
+            gain_filter_state=None,
+            previous_gain_envelope=np.ones((self.overlap_size, channels), dtype=np.float32),
             current_gain_level=1.0,
             samples_processed=0,
             frame_count=0
         )
         
-        # Initialize sliding window for peak detection
-        self.sliding_windows = [
-            StatefulSlidingWindow(self.attack_samples) for _ in range(channels)
-        ]
+        # Initialize sliding window for peak detection (all channels at once)
+        self.sliding_window = StatefulSlidingWindow(self.attack_samples, channels)
     
     def process_frame(self, audio_frame: np.ndarray, 
                      gain_adjust_db: float = 0.0) -> np.ndarray:
@@ -194,25 +205,24 @@ class FrameAwareLimiter:
         Process a single audio frame with limiting.
         
         Args:
-            audio_frame: Input audio frame (samples × channels)
+            audio_frame: Input audio frame (samples × channels). May be a
+                strided or read-only view; it is never written to.
             gain_adjust_db: Pre-limiter gain adjustment in dB
             
         Returns:
-            Limited audio frame
+            Limited audio frame, same number of samples as the input
         """
+        # Frames that aren't exactly frame_size long (such as the last,
+        # partial frame of a stream) go through the block path, which
+        # returns one delayed output sample per input sample instead of
+        # re-emitting a full frame from the lookahead buffer
+        if len(audio_frame) != self.config.frame_size:
+            return self.process_block(audio_frame, gain_adjust_db)
+        
         if self.state is None:
             self.reset_state()
         
-        # Ensure stereo input
-        if audio_frame.ndim == 1:
-            audio_frame = np.column_stack([audio_frame, audio_frame])
-        elif audio_frame.shape[1] == 1:
-            audio_frame = np.column_stack([audio_frame[:, 0], audio_frame[:, 0]])
-        
-        # Apply pre-limiter gain
-        if gain_adjust_db != 0:
-            gain_linear = 10 ** (gain_adjust_db / 20.0)
-            audio_frame = audio_frame * gain_linear
+        audio_frame = self._prepare_input(audio_frame, gain_adjust_db)
         
         # Add frame to lookahead buffer
         buffered_audio = self._update_lookahead_buffer(audio_frame)
@@ -224,101 +234,144 @@ class FrameAwareLimiter:
             )
         else:
             # Not enough samples for full processing - return dry signal
-            limited_frame = buffered_audio[:len(audio_frame)]
+            limited_frame = buffered_audio[:len(audio_frame)].copy()
         
         self.state.frame_count += 1
         self.state.samples_processed += len(audio_frame)
         
         return limited_frame
     
-    def _update_lookahead_buffer(self, new_frame: np.ndarray) -> np.ndarray:
-        """Update lookahead buffer with new audio frame."""
-        # Append new frame to buffer
-        self.state.lookahead_buffer = np.vstack([
-            self.state.lookahead_buffer,
-            new_frame
-        ])
-        
-        # Keep buffer size manageable
-        max_buffer_size = self.lookahead_size + self.config.frame_size
-        if len(self.state.lookahead_buffer) > max_buffer_size:
-            excess = len(self.state.lookahead_buffer) - max_buffer_size
-            self.state.lookahead_buffer = self.state.lookahead_buffer[excess:]
-        
-        return self.state.lookahead_buffer
-    
-    def _process_with_limiting(self, audio_buffer: np.ndarray) -> np.ndarray:
-        """Apply limiting algorithm to audio buffer."""
-        channels = audio_buffer.shape[1]
-        output_frame = np.zeros_like(audio_buffer)
+    def process_block(self, audio: np.ndarray,
+                      gain_adjust_db: float = 0.0) -> np.ndarray:
+        """
+        Process a contiguous block of any length with limiting in one pass.
         
-        # Process each channel
-        for ch in range(channels):
-            channel_audio = audio_buffer[:, ch]
-            
-            # Step 1: Peak detection with sliding window
-            peaks = self.sliding_windows[ch].process(channel_audio)
-            
-            # Step 2: Calculate gain reduction
-            threshold_linear = 10 ** (self.config.threshold_db / 20.0)
-            gain_reduction = np.minimum(1.0, threshold_linear / (peaks + 1e-10))
-            
-            # Step 3: Smooth gain reduction (attack stage)
-            smooth_gain = self._apply_attack_smoothing(gain_reduction, ch)
-            
-            # Step 4: Apply hold and release stages  
-            final_gain = self._apply_hold_release(smooth_gain, ch)
+        Gives the same result as feeding the block to process_frame in
+        full frames, including the lookahead delay, but runs the peak
+        detector and gain smoothing over the whole block at once instead
+        of per frame. State carries over, so blocks and frames can be mixed.
+        
+        Args:
+            audio: Input audio (samples × channels). May be a strided or
+                read-only view; it is never written to.
+            gain_adjust_db: Pre-limiter gain adjustment in dB
             
-            # Step 5: Apply gain to audio
-            output_frame[:, ch] = channel_audio * final_gain
+        Returns:
+            Limited audio, same number of samples as the input
+        """
+        if self.state is None:
+            self.reset_state()
+        
+        audio = self._prepare_input(audio, gain_adjust_db)
+        num_samples = len(audio)
+        if num_samples == 0:
+            return audio.copy()
+        
+        # Delay the block by the lookahead: prepend the samples still pending
+        # in the lookahead buffer and hold back the same number at the end
+        fill = self.state.lookahead_fill
+        pending = self.state.lookahead_buffer[fill - self.lookahead_size:fill]
+        delayed = np.concatenate([pending, audio])
+        
+        limited = self._process_with_limiting(delayed[:num_samples])
         
-        return output_frame
+        # Retain the newest samples as the pending lookahead
+        self.state.lookahead_buffer[:self.lookahead_size] = delayed[num_samples:]
+        self.state.lookahead_fill = self.lookahead_size
+        
+        self.state.frame_count += 1
+        self.state.samples_processed += num_samples
+        
+        return limited
     
-    def _apply_attack_smoothing(self, gain_reduction: np.ndarray, 
-                               channel: int) -> np.ndarray:
-        """Apply attack stage smoothing to gain reduction."""
-        # Use exponential smoothing instead of filtfilt for causality
-        smoothed = np.zeros_like(gain_reduction)
-        
-        # Initialize with previous state
-        if len(self.state.previous_gain_envelope) > 0:
-            prev_gain = self.state.previous_gain_envelope[-1]
+    def _prepare_input(self, audio: np.ndarray, gain_adjust_db: float) -> np.ndarray:
+        """Cast input to float32 stereo and apply the pre-limiter gain."""
+        # Limiter runs in single precision throughout
+        audio = np.asarray(audio, dtype=np.float32)
+        
+        # Ensure stereo input (zero-copy view; downstream stages never write to it)
+        if audio.ndim == 1:
+            audio = np.broadcast_to(audio[:, np.newaxis], (len(audio), 2))
+        elif audio.shape[1] == 1:
+            audio = np.broadcast_to(audio, (len(audio), 2))
+        
+        # Apply pre-limiter gain
+        if gain_adjust_db != 0:
+            audio = audio * self._db_to_linear(gain_adjust_db)
+        
+        return audio
+    
+    def _db_to_linear(self, gain_db: float) -> float:
+        """Convert dB to linear gain, reusing the last result while unchanged."""
+        if gain_db != self._last_gain_db:
+            self._last_gain_linear = 10 ** (gain_db / 20.0)
+            self._last_gain_db = gain_db
+        return self._last_gain_linear
+    
+    def _update_lookahead_buffer(self, new_frame: np.ndarray) -> np.ndarray:
+        """
+        Update lookahead buffer with new audio frame.
+        
+        The buffer is a preallocated C-contiguous float32 array that is
+        shifted in place, so no per-frame reallocation takes place. The
+        returned view is only valid until the next call.
+        """
+        buffer = self.state.lookahead_buffer
+        max_buffer_size = len(buffer)
+        fill = self.state.lookahead_fill
+        new_size = len(new_frame)
+        
+        if new_size >= max_buffer_size:
+            # Frame alone fills the buffer; keep its most recent samples
+            buffer[:] = new_frame[new_size - max_buffer_size:]
+            fill = max_buffer_size
         else:
-            prev_gain = 1.0
+            # Keep buffer size manageable by dropping the oldest samples,
+            # then append the new frame after the retained ones
+            keep = min(fill, max_buffer_size - new_size)
+            buffer[:keep] = buffer[fill - keep:fill]
+            buffer[keep:keep + new_size] = new_frame
+            fill = keep + new_size
+        
+        self.state.lookahead_fill = fill
+        return buffer[:fill]
+    
+    def _process_with_limiting(self, audio_buffer: np.ndarray) -> np.ndarray:
+        """Apply limiting algorithm to audio buffer (all channels at once)."""
+        # Step 1: Peak detection with sliding window
+        peaks = self.sliding_window.process(audio_buffer)
         
-        # Apply exponential smoothing
-        for i, gain in enumerate(gain_reduction):
-            if i == 0:
-                smoothed[i] = self.attack_alpha * prev_gain + (1 - self.attack_alpha) * gain
-            else:
-                smoothed[i] = self.attack_alpha * smoothed[i-1] + (1 - self.attack_alpha) * gain
+        # Step 2: Calculate gain reduction
+        gain_reduction = np.minimum(1.0, self.threshold_linear / (peaks + 1e-10))
+        
+        # Step 3: Smooth gain reduction (attack, hold and release stages)
+        final_gain = self._apply_gain_smoothing(gain_reduction)
         
-        return smoothed
+        # Step 4: Apply gain to audio
+        return audio_buffer * final_gain
     
-    def _apply_hold_release(self, gain_envelope: np.ndarray, 
-                           channel: int) -> np.ndarray:
-        """Apply hold and release stages using stateful filters."""
-        # Initialize filter states if needed
-        if self.state.hold_filter_state is None:
-            self.state.hold_filter_state = signal.lfilter_zi(
-                self.hold_filter_b, self.hold_filter_a
-            ) * gain_envelope[0]
-        
-        if self.state.release_filter_state is None:
-            self.state.release_filter_state = signal.lfilter_zi(
-                self.release_filter_b, self.release_filter_a  
-            ) * gain_envelope[0]
-        
-        # Apply hold filter
-        hold_output, self.state.hold_filter_state = signal.lfilter(
-            self.hold_filter_b, self.hold_filter_a, gain_envelope,
-            zi=self.state.hold_filter_state
-        )
+    def _apply_gain_smoothing(self, gain_reduction: np.ndarray) -> np.ndarray:
+        """
+        Apply attack, hold and release smoothing to gain reduction.
         
-        # Apply release filter  
-        final_output, self.state.release_filter_state = signal.lfilter(
-            self.release_filter_b, self.release_filter_a, hold_output,
-            zi=self.state.release_filter_state
+        All three stages run as one stateful cascade of second-order
+        sections over (samples × channels), keeping per-channel state
+        across frames.
+        """
+        # Initialize filter state at steady state for the previous gain
+        if self.state.gain_filter_state is None:
+            if len(self.state.previous_gain_envelope) > 0:
+                prev_gain = self.state.previous_gain_envelope[-1]
+            else:
+                prev_gain = np.ones(gain_reduction.shape[1])
+            
+            self.state.gain_filter_state = (
+                signal.sosfilt_zi(self.gain_sos)[:, :, np.newaxis] * prev_gain
+            ).astype(np.float32)
+        
+        final_output, self.state.gain_filter_state = signal.sosfilt(
+            self.gain_sos, gain_reduction, axis=0,
+            zi=self.state.gain_filter_state
         )
         
         # Update state for next frame
@@ -336,7 +389,7 @@ class FrameAwareLimiter:
             "initialized": True,
             "frame_count": self.state.frame_count,
             "samples_processed": self.state.samples_processed,
-            "buffer_size": len(self.state.lookahead_buffer),
+            "buffer_size": self.state.lookahead_fill,
             "current_gain": self.state.current_gain_level,
             "config": {
                 "attack_ms": self.config.attack_ms,
@@ -359,6 +412,8 @@ class FrameAwareLimiterProcessor:
         self.sample_rate = sample_rate
         self.frame_size = frame_size
         self.limiter = None
+        self._last_gain_db = None
+        self._last_gain_linear = 1.0
     
     def initialize_limiter(self, config_params: Optional[Dict[str, Any]] = None) -> None:
         """Initialize limiter with optional custom parameters."""
@@ -393,8 +448,7 @@ class FrameAwareLimiterProcessor:
         if not enable_limiter:
             # Apply gain without limiting
             if gain_adjust_db != 0:
-                gain_linear = 10 ** (gain_adjust_db / 20.0)
-                return audio_frame * gain_linear
+                return audio_frame * self._db_to_linear(gain_adjust_db)
             return audio_frame
         
         if self.limiter is None:
@@ -402,6 +456,35 @@ class FrameAwareLimiterProcessor:
         
         return self.limiter.process_frame(audio_frame, gain_adjust_db)
     
+    def process_audio_batch(self, audio: np.ndarray,
+                            gain_adjust_db: float = 0.0,
+                            enable_limiter: bool = True) -> np.ndarray:
+        """
+        Process a whole stream (or a long block of it) in a single call.
+        
+        Args:
+            audio: Input audio (samples × channels)
+            gain_adjust_db: Pre-limiter gain adjustment
+            enable_limiter: Whether to apply limiting
+            
+        Returns:
+            Processed audio, same number of samples as the input
+        """
+        if not enable_limiter:
+            return self.process_audio_frame(audio, gain_adjust_db, enable_limiter=False)
+        
+        if self.limiter is None:
+            self.initialize_limiter()
+        
+        return self.limiter.process_block(audio, gain_adjust_db)
+    
+    def _db_to_linear(self, gain_db: float) -> float:
+        """Convert dB to linear gain, reusing the last result while unchanged."""
+        if gain_db != self._last_gain_db:
+            self._last_gain_linear = 10 ** (gain_db / 20.0)
+            self._last_gain_db = gain_db
+        return self._last_gain_linear
+    
     def reset(self):
         """Reset limiter state."""
         if self.limiter is not None:
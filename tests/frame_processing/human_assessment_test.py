@@ -8,11 +8,16 @@ limiters to enable subjective quality comparison.
 
 import os
 import sys
+import io
+import contextlib
+import queue
+import threading
 import numpy as np
 import soundfile as sf
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Optional, Union
 
 # Add project paths
 project_root = os.path.join(os.path.dirname(__file__), '../..')
@@ -34,13 +39,73 @@ except ImportError as e:
     ORIGINAL_LIMITER_AVAILABLE = False
 
 
+class BackgroundAudioWriter:
+    """
+    Writes audio files on a background thread.
+    
+    Lets limiter processing continue while earlier results are encoded
+    and written; libsndfile releases the GIL during writes. Use as a
+    context manager: leaving the block waits for all queued writes.
+    
+    Args:
+        max_pending: Maximum number of queued writes before write() blocks,
+            bounding the memory held by pending audio (0 for unbounded)
+    """
+    
+    def __init__(self, max_pending: int = 0):
+        self._queue = queue.Queue(maxsize=max_pending)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+    
+    def write(self, path: str, audio: np.ndarray, sample_rate: int, **kwargs) -> None:
+        """Queue an audio file for writing."""
+        self._queue.put((path, audio, sample_rate, kwargs))
+    
+    def close(self) -> None:
+        """Wait for all queued writes to finish and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+    
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            
+            path, audio, sample_rate, kwargs = item
+            try:
+                sf.write(path, audio, sample_rate, **kwargs)
+            except Exception as e:
+                print(f"    ❌ Failed to write {os.path.basename(path)}: {e}")
+    
+    def __enter__(self) -> 'BackgroundAudioWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
 class HumanAssessmentTest:
     """Application for human assessment of limiter implementations."""
     
-    def __init__(self, input_dir: str = "test_audio", output_dir: str = "human_assessment_results"):
+    def __init__(self, input_dir: str = "test_audio", output_dir: str = "human_assessment_results",
+                 max_workers: Optional[int] = None):
         self.input_dir = input_dir
         self.output_dir = output_dir
         
+        # Worker processes for per-file processing (defaults to CPU count)
+        self.max_workers = max_workers
+        
+        # Frame limiter frame size (samples); larger frames mean fewer calls
+        # for callers that feed the limiter frame by frame
+        self.frame_size = 16384
+        
+        # Block size (samples) for streaming frame limiter output to disk
+        self.stream_block_size = 65536
+        
+        # Frame limiter processors, reused across files per sample rate and config
+        self._frame_processors: Dict[Tuple, FrameAwareLimiterProcessor] = {}
+        
         # Create directories
         os.makedirs(input_dir, exist_ok=True)
         os.makedirs(output_dir, exist_ok=True)
@@ -72,31 +137,43 @@ class HumanAssessmentTest:
             }
         }
     
+    def __getstate__(self) -> Dict:
+        """Pickle without the processor cache; worker processes build their own."""
+        state = self.__dict__.copy()
+        state['_frame_processors'] = {}
+        return state
+    
     def find_audio_files(self) -> List[Path]:
         """Find all supported audio files in the input directory."""
-        audio_files = []
+        extensions = tuple(self.supported_formats)
         
-        for ext in self.supported_formats:
-            pattern = f"*{ext}"
-            audio_files.extend(Path(self.input_dir).glob(pattern))
-            audio_files.extend(Path(self.input_dir).glob(pattern.upper()))
+        # Single directory pass; extensions are matched case-insensitively
+        with os.scandir(self.input_dir) as entries:
+            audio_files = [
+                Path(entry.path) for entry in entries
+                if entry.name.lower().endswith(extensions) and entry.is_file()
+            ]
         
         return sorted(audio_files)
     
-    def load_audio_file(self, file_path: Path) -> Tuple[np.ndarray, int]:
-        """Load audio file and ensure stereo format."""
+    def load_audio_file(self, file_path: Path,
+                        decoded: Optional[Union[Tuple[np.ndarray, int], Exception]] = None
+                        ) -> Tuple[np.ndarray, int]:
+        """
+        Load audio file and ensure stereo format.
+        
+        Args:
+            file_path: Audio file to load
+            decoded: Result of an earlier _decode_audio call (or the exception
+                it raised) when the file was read ahead on a loader thread
+        """
         try:
-            audio, sample_rate = sf.read(str(file_path))
-            
-            # Convert to stereo if needed
-            if audio.ndim == 1:
-                audio = np.column_stack([audio, audio])
-            elif audio.shape[1] == 1:
-                audio = np.column_stack([audio[:, 0], audio[:, 0]])
-            elif audio.shape[1] > 2:
-                # Take first two channels for stereo
-                audio = audio[:, :2]
+            if decoded is None:
+                decoded = self._decode_audio(file_path)
+            elif isinstance(decoded, Exception):
+                raise decoded
             
+            audio, sample_rate = decoded
             print(f"  Loaded: {audio.shape[0]} samples, {sample_rate}Hz, {audio.shape[1]} channels")
             return audio, sample_rate
             
@@ -104,6 +181,33 @@ class HumanAssessmentTest:
             print(f"  ❌ Failed to load {file_path}: {e}")
             return None, None
     
+    def _decode_audio(self, file_path: Path) -> Tuple[np.ndarray, int]:
+        """Decode an audio file to float32 stereo without any console output."""
+        with sf.SoundFile(str(file_path)) as f:
+            sample_rate = f.samplerate
+            
+            if f.channels <= 2:
+                audio = f.read(dtype='float32', always_2d=True)
+            else:
+                # Take first two channels for stereo. Decode block by block
+                # into a two-channel array so the full multichannel signal
+                # is never held in memory.
+                block = np.empty((self.stream_block_size, f.channels), dtype=np.float32)
+                audio = np.empty((f.frames, 2), dtype=np.float32)
+                
+                num_read = 0
+                for data in f.blocks(out=block):
+                    audio[num_read:num_read + len(data)] = data[:, :2]
+                    num_read += len(data)
+                audio = audio[:num_read]
+        
+        # Convert to stereo if needed. Mono is widened with a read-only
+        # broadcast view; the limiters never write to their input.
+        if audio.shape[1] == 1:
+            audio = np.broadcast_to(audio, (len(audio), 2))
+        
+        return audio, sample_rate
+    
     def process_with_original_limiter(self, audio: np.ndarray, config_params: Dict,
                                     sample_rate: int) -> Tuple[np.ndarray, float]:
         """Process audio with original monolithic limiter."""
@@ -126,8 +230,9 @@ class HumanAssessmentTest:
             if 'release_ms' in config_params:
                 config.release = config_params['release_ms']
             
-            # Apply limiter
-            limited_audio = limit(audio, config)
+            # Apply limiter. Matchering works in double precision, so the
+            # float32 audio is upcast here only; the frame limiter stays float32.
+            limited_audio = limit(audio.astype(np.float64), config)
             processing_time = time.time() - start_time
             
             return limited_audio, processing_time
@@ -137,42 +242,87 @@ class HumanAssessmentTest:
             return audio * 0.9, 0.0
     
     def process_with_frame_limiter(self, audio: np.ndarray, config_params: Dict,
-                                 sample_rate: int) -> Tuple[np.ndarray, float]:
-        """Process audio with frame-aware limiter."""
+                                 sample_rate: int,
+                                 output_path: Optional[str] = None) -> Tuple[Optional[np.ndarray], float]:
+        """
+        Process audio with frame-aware limiter.
+        
+        If output_path is given, the result is streamed to that file block by
+        block instead of being held in memory, and None is returned in place
+        of the audio. The processing time excludes the disk writes.
+        """
         try:
             start_time = time.time()
             
-            # Initialize frame processor
-            processor = FrameAwareLimiterProcessor(sample_rate=sample_rate, frame_size=4096)
-            processor.initialize_limiter(config_params)
-            
-            # Process in frames
-            frame_size = 4096
-            frame_results = []
+            processor = self._get_frame_processor(config_params, sample_rate)
             
-            for start_idx in range(0, len(audio), frame_size):
-                end_idx = min(start_idx + frame_size, len(audio))
-                frame = audio[start_idx:end_idx]
+            if output_path is None:
+                # Process the whole file in one vectorized pass; equivalent to
+                # feeding it frame by frame, without the per-frame Python overhead
+                limited_audio = processor.process_audio_batch(audio, enable_limiter=True)
+                processing_time = time.time() - start_time
                 
-                processed_frame = processor.process_audio_frame(frame, enable_limiter=True)
-                frame_results.append(processed_frame)
+                return limited_audio, processing_time
             
-            # Concatenate results
-            limited_audio = np.vstack(frame_results)
             processing_time = time.time() - start_time
+            block_size = self.stream_block_size
             
-            return limited_audio, processing_time
+            with sf.SoundFile(output_path, 'w', samplerate=sample_rate,
+                              channels=audio.shape[1], subtype='PCM_16') as f:
+                for start_idx in range(0, len(audio), block_size):
+                    start_time = time.time()
+                    limited_block = processor.process_audio_batch(
+                        audio[start_idx:start_idx + block_size], enable_limiter=True
+                    )
+                    processing_time += time.time() - start_time
+                    
+                    np.clip(limited_block, -1.0, 1.0, out=limited_block)
+                    f.write(limited_block)
+            
+            return None, processing_time
             
         except Exception as e:
             print(f"    ❌ Frame limiter failed: {e}")
             return audio * 0.9, 0.0
     
-    def process_single_file(self, file_path: Path) -> Dict:
-        """Process a single audio file with all configurations."""
+    def _get_frame_processor(self, config_params: Dict,
+                             sample_rate: int) -> FrameAwareLimiterProcessor:
+        """
+        Return a frame limiter processor for this sample rate and configuration.
+        
+        Processors are created and initialized once, then only have their
+        state reset for each new file. Each configuration gets its own
+        processor so concurrent configurations never share limiter state.
+        """
+        key = (sample_rate, tuple(sorted(config_params.items())))
+        processor = self._frame_processors.get(key)
+        
+        if processor is None:
+            processor = FrameAwareLimiterProcessor(sample_rate=sample_rate,
+                                                   frame_size=self.frame_size)
+            processor.initialize_limiter(config_params)
+            self._frame_processors[key] = processor
+        else:
+            processor.reset()
+        
+        return processor
+    
+    def process_single_file(self, file_path: Path,
+                            writer: Optional[BackgroundAudioWriter] = None,
+                            decoded: Optional[Union[Tuple[np.ndarray, int], Exception]] = None
+                            ) -> Dict:
+        """
+        Process a single audio file with all configurations.
+        
+        Args:
+            file_path: Audio file to process
+            writer: Shared output writer; a private one is used if omitted
+            decoded: Audio already decoded by a loader thread, if any
+        """
         print(f"\n🎵 Processing: {file_path.name}")
         
         # Load audio
-        audio, sample_rate = self.load_audio_file(file_path)
+        audio, sample_rate = self.load_audio_file(file_path, decoded)
         if audio is None:
             return {'error': 'Failed to load audio'}
         
@@ -183,123 +333,238 @@ class HumanAssessmentTest:
             'configurations': {}
         }
         
-        # Process with each configuration
-        for config_id, config_info in self.test_configs.items():
-            print(f"  📋 Config: {config_info['name']}")
+        # Cast once so neither limiter has to convert per configuration. Strided
+        # views (broadcast mono, channel subsets) are accepted as they are.
+        audio = np.asarray(audio, dtype=np.float32)
+        
+        # All outputs for this file share one path prefix
+        output_prefix = os.path.join(self.output_dir, file_path.stem)
+        input_path = f"{output_prefix}_input.wav"
+        input_filename = os.path.basename(input_path)
+        
+        # Run all configurations concurrently. The limiters spend most of their
+        # time in NumPy/SciPy code that releases the GIL, so threads suffice
+        # and the audio array is shared rather than copied. Results are
+        # written on a separate thread so disk I/O overlaps with processing.
+        with (BackgroundAudioWriter() if writer is None else contextlib.nullcontext(writer)) as writer, \
+                ThreadPoolExecutor(max_workers=len(self.test_configs)) as executor:
+            # Save input file for reference. The audio is shared with the
+            # limiters (and may be a read-only view), so it is not pre-clipped.
+            if not os.path.exists(input_path):
+                writer.write(input_path, audio, sample_rate, subtype='PCM_16')
+                print(f"  💾 Saved input: {input_filename}")
             
-            config_results = {
-                'name': config_info['name'],
-                'params': config_info['params'],
-                'files': {}
+            futures = {
+                config_id: executor.submit(
+                    self._process_config, audio, config_info['params'], sample_rate,
+                    f"{output_prefix}_{config_id}_frame.wav"
+                )
+                for config_id, config_info in self.test_configs.items()
             }
             
-            # Create output filenames
-            base_name = file_path.stem
-            original_filename = f"{base_name}_{config_id}_original.wav"
-            frame_filename = f"{base_name}_{config_id}_frame.wav"
-            input_filename = f"{base_name}_input.wav"
-            
-            # Save input file for reference
-            input_path = os.path.join(self.output_dir, input_filename)
-            if not os.path.exists(input_path):
-                sf.write(input_path, audio, sample_rate)
-                print(f"    💾 Saved input: {input_filename}")
-            
-            # Process with original limiter
-            print("    🔧 Processing with original limiter...")
+            for config_id, config_info in self.test_configs.items():
+                results['configurations'][config_id] = self._save_config_results(
+                    writer, output_prefix, input_filename, sample_rate, config_id, config_info,
+                    *futures[config_id].result()
+                )
+        
+        return results
+    
+    def _process_config(self, audio: np.ndarray, config_params: Dict, sample_rate: int,
+                        frame_path: str) -> Tuple[Optional[np.ndarray], Optional[float],
+                                                  Optional[np.ndarray], float]:
+        """
+        Run both limiters for one configuration (called on a worker thread).
+        
+        The frame limiter output is streamed straight to frame_path, so its
+        audio is only returned if streaming failed and a fallback is needed.
+        The original limiter is skipped (None results) when unavailable.
+        """
+        if ORIGINAL_LIMITER_AVAILABLE:
             original_audio, original_time = self.process_with_original_limiter(
-                audio, config_info['params'], sample_rate
+                audio, config_params, sample_rate
             )
-            
-            original_path = os.path.join(self.output_dir, original_filename)
-            sf.write(original_path, original_audio, sample_rate)
+        else:
+            original_audio, original_time = None, None
+
+        frame_audio, frame_time = self.process_with_frame_limiter(
+            audio, config_params, sample_rate, output_path=frame_path
+        )
+        return original_audio, original_time, frame_audio, frame_time
+    
+    def _save_config_results(self, writer: BackgroundAudioWriter,
+                             output_prefix: str, input_filename: str, sample_rate: int,
+                             config_id: str, config_info: Dict,
+                             original_audio: Optional[np.ndarray], original_time: Optional[float],
+                             frame_audio: Optional[np.ndarray], frame_time: float) -> Dict:
+        """Queue one configuration's outputs for writing and return its result entry."""
+        print(f"  📋 Config: {config_info['name']}")
+        
+        config_results = {
+            'name': config_info['name'],
+            'params': config_info['params'],
+            'files': {}
+        }
+        
+        # Create output paths and filenames
+        original_path = f"{output_prefix}_{config_id}_original.wav"
+        frame_path = f"{output_prefix}_{config_id}_frame.wav"
+        frame_filename = os.path.basename(frame_path)
+        
+        # Nothing to compare against when the original limiter is unavailable
+        if original_audio is not None:
+            original_filename = os.path.basename(original_path)
+            np.clip(original_audio, -1.0, 1.0, out=original_audio)
+            writer.write(original_path, original_audio, sample_rate, subtype='PCM_16')
             print(f"    💾 Saved: {original_filename} ({original_time:.2f}s)")
-            
-            # Process with frame limiter
-            print("    🔧 Processing with frame limiter...")
-            frame_audio, frame_time = self.process_with_frame_limiter(
-                audio, config_info['params'], sample_rate
-            )
-            
-            frame_path = os.path.join(self.output_dir, frame_filename)
-            sf.write(frame_path, frame_audio, sample_rate)
-            print(f"    💾 Saved: {frame_filename} ({frame_time:.2f}s)")
-            
-            # Store results
-            config_results['files'] = {
-                'input': input_filename,
-                'original': original_filename,
-                'frame': frame_filename
-            }
-            config_results['processing_times'] = {
-                'original': original_time,
-                'frame': frame_time
-            }
-            
-            results['configurations'][config_id] = config_results
+        else:
+            original_filename = None
+            print("    ⚠ Original limiter not available, skipped")
         
-        return results
+        # The frame limiter output has already been streamed to disk
+        if frame_audio is not None:
+            np.clip(frame_audio, -1.0, 1.0, out=frame_audio)
+            writer.write(frame_path, frame_audio, sample_rate, subtype='PCM_16')
+        print(f"    💾 Saved: {frame_filename} ({frame_time:.2f}s)")
+        
+        # Store results
+        config_results['files'] = {
+            'input': input_filename,
+            'original': original_filename,
+            'frame': frame_filename
+        }
+        config_results['processing_times'] = {
+            'original': original_time,
+            'frame': frame_time
+        }
+        
+        return config_results
+    
+    def _process_file_captured(self, file_path: Path) -> Tuple[Dict, str]:
+        """Process a single file in a worker, capturing its console output."""
+        log = io.StringIO()
+        with contextlib.redirect_stdout(log):
+            result = self.process_single_file(file_path)
+        return result, log.getvalue()
+    
+    def process_files(self, audio_files: List[Path]) -> List[Dict]:
+        """
+        Process all files, spreading them across worker processes.
+        
+        Files are independent, so they are processed in parallel. Each
+        worker's output is printed as one block, in file order, to keep
+        the console log readable.
+        """
+        workers = min(self.max_workers or os.cpu_count() or 1, len(audio_files))
+        if workers <= 1:
+            return self._process_files_pipelined(audio_files)
+        
+        all_results = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for result, log in executor.map(self._process_file_captured, audio_files):
+                print(log, end='')
+                all_results.append(result)
+        
+        return all_results
+    
+    def _process_files_pipelined(self, audio_files: List[Path]) -> List[Dict]:
+        """
+        Process files in one process as a load → process → write pipeline.
+        
+        A loader thread decodes ahead into a bounded queue while the current
+        file is limited, and a shared writer thread saves the results. The
+        queue sizes cap memory at two decoded files plus one file's pending
+        outputs.
+        """
+        load_queue = queue.Queue(maxsize=2)
+        
+        def loader():
+            for file_path in audio_files:
+                try:
+                    decoded = self._decode_audio(file_path)
+                except Exception as e:
+                    decoded = e
+                load_queue.put((file_path, decoded))
+        
+        loader_thread = threading.Thread(target=loader, daemon=True)
+        loader_thread.start()
+        
+        all_results = []
+        with BackgroundAudioWriter(max_pending=len(self.test_configs) + 1) as writer:
+            for _ in audio_files:
+                file_path, decoded = load_queue.get()
+                all_results.append(self.process_single_file(file_path, writer, decoded))
+        
+        loader_thread.join()
+        return all_results
     
     def generate_listening_guide(self, all_results: List[Dict]) -> str:
         """Generate a listening guide for human assessment."""
         guide_path = os.path.join(self.output_dir, "LISTENING_GUIDE.md")
         
-        with open(guide_path, 'w') as f:
-            f.write("# Human Assessment Listening Guide\n\n")
-            f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write("## How to Use This Guide\n\n")
-            f.write("1. Use high-quality headphones or studio monitors\n")
-            f.write("2. Listen to each pair of files (original vs frame) at moderate volume\n")
-            f.write("3. Pay attention to:\n")
-            f.write("   - Overall loudness and dynamics\n")
-            f.write("   - Transient response (drums, percussion)\n")
-            f.write("   - Musical character and clarity\n")
-            f.write("   - Any audible artifacts or distortion\n")
-            f.write("4. Note your preferences and observations\n\n")
+        # Collect the guide text and write it in a single call
+        parts = []
+        
+        parts.append("# Human Assessment Listening Guide\n\n")
+        parts.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        parts.append("## How to Use This Guide\n\n")
+        parts.append("1. Use high-quality headphones or studio monitors\n")
+        parts.append("2. Listen to each pair of files (original vs frame) at moderate volume\n")
+        parts.append("3. Pay attention to:\n")
+        parts.append("   - Overall loudness and dynamics\n")
+        parts.append("   - Transient response (drums, percussion)\n")
+        parts.append("   - Musical character and clarity\n")
+        parts.append("   - Any audible artifacts or distortion\n")
+        parts.append("4. Note your preferences and observations\n\n")
+        
+        parts.append("## Test Files\n\n")
+        
+        for result in all_results:
+            if 'error' in result:
+                continue
+                
+            parts.append(f"### {result['filename']}\n")
+            parts.append(f"- Duration: {result['duration_seconds']:.1f} seconds\n")
+            parts.append(f"- Sample Rate: {result['sample_rate']} Hz\n\n")
             
-            f.write("## Test Files\n\n")
+            parts.append("**File Comparisons:**\n\n")
             
-            for result in all_results:
-                if 'error' in result:
-                    continue
-                    
-                f.write(f"### {result['filename']}\n")
-                f.write(f"- Duration: {result['duration_seconds']:.1f} seconds\n")
-                f.write(f"- Sample Rate: {result['sample_rate']} Hz\n\n")
-                
-                f.write("**File Comparisons:**\n\n")
+            for config_id, config_data in result['configurations'].items():
+                parts.append(f"#### {config_data['name']}\n")
+                parts.append(f"- Input: `{config_data['files']['input']}`\n")
+                if config_data['files']['original']:
+                    parts.append(f"- Original Limiter: `{config_data['files']['original']}`\n")
+                else:
+                    parts.append("- Original Limiter: (unavailable)\n")
+                parts.append(f"- Frame Limiter: `{config_data['files']['frame']}`\n")
                 
-                for config_id, config_data in result['configurations'].items():
-                    f.write(f"#### {config_data['name']}\n")
-                    f.write(f"- Input: `{config_data['files']['input']}`\n")
-                    f.write(f"- Original Limiter: `{config_data['files']['original']}`\n")
-                    f.write(f"- Frame Limiter: `{config_data['files']['frame']}`\n")
-                    
-                    if config_data['params']:
-                        f.write(f"- Settings: {config_data['params']}\n")
-                    
-                    f.write("\\n")
+                if config_data['params']:
+                    parts.append(f"- Settings: {config_data['params']}\n")
                 
-                f.write("---\\n\\n")
-            
-            f.write("## Assessment Questions\n\n")
-            f.write("For each file pair, consider:\n\n")
-            f.write("1. **Overall Quality**: Which version sounds better overall?\n")
-            f.write("2. **Loudness**: Do both versions achieve similar perceived loudness?\n")
-            f.write("3. **Dynamics**: How well are the dynamics preserved?\n")
-            f.write("4. **Transients**: Are drum hits and percussive elements handled well?\n")
-            f.write("5. **Artifacts**: Do you hear any pumping, distortion, or other artifacts?\n")
-            f.write("6. **Musical Character**: Which version maintains the musical character better?\n\n")
+                parts.append("\n")
             
-            f.write("## Notes Section\n\n")
-            f.write("Use this space for your observations:\n\n")
-            f.write("```\n")
-            f.write("File: ________________\n")
-            f.write("Config: ______________\n")
-            f.write("Preference: Original / Frame / No difference\n")
-            f.write("Notes: \n\n\n")
-            f.write("```\n\n")
+            parts.append("---\n\n")
+        
+        parts.append("## Assessment Questions\n\n")
+        parts.append("For each file pair, consider:\n\n")
+        parts.append("1. **Overall Quality**: Which version sounds better overall?\n")
+        parts.append("2. **Loudness**: Do both versions achieve similar perceived loudness?\n")
+        parts.append("3. **Dynamics**: How well are the dynamics preserved?\n")
+        parts.append("4. **Transients**: Are drum hits and percussive elements handled well?\n")
+        parts.append("5. **Artifacts**: Do you hear any pumping, distortion, or other artifacts?\n")
+        parts.append("6. **Musical Character**: Which version maintains the musical character better?\n\n")
+        
+        parts.append("## Notes Section\n\n")
+        parts.append("Use this space for your observations:\n\n")
+        parts.append("```\n")
+        parts.append("File: ________________\n")
+        parts.append("Config: ______________\n")
+        parts.append("Preference: Original / Frame / No difference\n")
+        parts.append("Notes: \n\n\n")
+        parts.append("```\n\n")
+        
+        Path(guide_path).write_text(''.join(parts), encoding='utf-8')
         
         return guide_path
     
@@ -329,11 +594,7 @@ class HumanAssessmentTest:
             print(f"   - {file_path.name}")
         
         # Process all files
-        all_results = []
-        
-        for file_path in audio_files:
-            result = self.process_single_file(file_path)
-            all_results.append(result)
+        all_results = self.process_files(audio_files)
         
         # Generate listening guide
         guide_path = self.generate_listening_guide(all_results)
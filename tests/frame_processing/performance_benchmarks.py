@@ -5,17 +5,103 @@ This module provides comprehensive performance analysis tools for comparing
 frame-based and monolithic audio processing approaches.
 """
 
+import os
+import sys
 import time
+import pickle
+import signal
 import psutil
 import numpy as np
 import threading
-from typing import Dict, List, Tuple, Optional, Callable
+from typing import Dict, List, Set, Tuple, Optional, Callable
 from dataclasses import dataclass
 from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 import gc
 
+try:
+    import resource
+except ImportError:  # Not available on Windows
+    resource = None
 
-@dataclass
+
+def _reserved_monitor_cpus() -> Optional[Set[int]]:
+    """
+    Pick a CPU to reserve for profiler threads.
+    
+    Returns None where thread affinity is unsupported (non-Linux) or only
+    one CPU is available, in which case nothing is pinned.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    
+    allowed = os.sched_getaffinity(0)
+    if len(allowed) < 2:
+        return None
+    
+    return {min(allowed)}
+
+
+# Profiler threads run here; benchmarked calls are kept off it
+MONITOR_CPUS = _reserved_monitor_cpus()
+
+
+def _pin_to_monitor_cpus(thread: threading.Thread) -> None:
+    """Pin a running monitor thread to the reserved profiler CPU."""
+    if MONITOR_CPUS is None:
+        return
+    
+    try:
+        os.sched_setaffinity(thread.native_id, MONITOR_CPUS)
+    except OSError:
+        pass
+
+
+# Metric names used as result keys. Interned so lookups against names built
+# at runtime (memory_*/cpu_*) compare by identity.
+_METRIC_EXECUTION_TIME = sys.intern("execution_time")
+_METRIC_SUCCESS = sys.intern("success")
+_METRIC_ERROR = sys.intern("error")
+_METRIC_MEMORY_PEAK = sys.intern("memory_peak_mb")
+_METRIC_CPU_AVERAGE = sys.intern("cpu_average_percent")
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """
+    Kernel-maintained peak RSS of this process in MB, or None where
+    getrusage isn't available.
+    """
+    if resource is None:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def _collect_garbage_if_needed(threshold: int = 10) -> None:
+    """
+    Run a full garbage collection only when the oldest generation has
+    accumulated work, i.e. more than threshold younger collections since
+    the last full one.
+    """
+    if gc.get_count()[2] > threshold:
+        gc.collect()
+
+
+@contextmanager
+def _gc_paused():
+    """Keep the cyclic garbage collector from running inside a timed region."""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+@dataclass(slots=True)
 class PerformanceMetric:
     """Container for individual performance measurements."""
     name: str
@@ -24,48 +110,170 @@ class PerformanceMetric:
     description: str
 
 
-@dataclass
+def describe_metric(name: str, error_message: Optional[str] = None) -> Tuple[str, str]:
+    """Return the (unit, description) of a benchmark metric by name."""
+    if name == _METRIC_EXECUTION_TIME:
+        return "seconds", "Total execution time"
+    if name == _METRIC_SUCCESS:
+        return "bool", "Execution success"
+    if name == _METRIC_ERROR:
+        return "bool", f"Execution failed: {error_message}"
+    if name.startswith("memory_"):
+        return "MB", f"Memory: {name[len('memory_'):]}"
+    if name.startswith("cpu_"):
+        return "%", f"CPU: {name[len('cpu_'):]}"
+    return "", name
+
+
+@dataclass(slots=True)
 class BenchmarkResult:
-    """Container for benchmark results."""
+    """
+    Container for benchmark results.
+    
+    Metric values are stored by name; units and descriptions are static
+    per name and only materialized through the metrics property.
+    """
     test_name: str
-    metrics: List[PerformanceMetric]
+    values: Dict[str, float]
     timestamp: float
     duration_seconds: float
+    error_message: Optional[str] = None
+    
+    @property
+    def metrics(self) -> List[PerformanceMetric]:
+        """Metrics as PerformanceMetric objects, built on access."""
+        return [
+            PerformanceMetric(name, value, *describe_metric(name, self.error_message))
+            for name, value in self.values.items()
+        ]
 
 
-class MemoryProfiler:
-    """Tracks memory usage during processing."""
+class SampleRingBuffer:
+    """
+    Fixed-capacity float32 sample store.
+    
+    Preallocated once; when full, the oldest samples are overwritten so
+    long monitoring runs keep the most recent window without growing.
+    """
+    
+    def __init__(self, capacity: int = 1):
+        self.buffer = np.empty(max(1, capacity), dtype=np.float32)
+        self.count = 0  # Total samples ever appended
+    
+    def append(self, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        self.buffer[self.count % len(self.buffer)] = value
+        self.count += 1
+    
+    def values(self) -> np.ndarray:
+        """Retained samples as a contiguous view, oldest first until wrapped."""
+        if self.count <= len(self.buffer):
+            return self.buffer[:self.count]
+        return self.buffer
+    
+    def __len__(self) -> int:
+        return min(self.count, len(self.buffer))
+
+
+class RunningStats:
+    """Online mean, variance and peak of a sample stream (Welford's algorithm)."""
     
     def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.peak = 0.0
+        self._m2 = 0.0
+    
+    def add(self, value: float) -> None:
+        """Fold one sample into the statistics in O(1)."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        self.peak = value if self.count == 1 else max(self.peak, value)
+    
+    @property
+    def variance(self) -> float:
+        """Population variance of the samples so far."""
+        return self._m2 / self.count if self.count else 0.0
+
+
+def _ring_capacity(sample_interval: float, max_duration: float) -> int:
+    """Number of samples needed to cover max_duration at sample_interval."""
+    return int(max_duration / sample_interval) + 1
+
+
+class MemoryProfiler:
+    """
+    Tracks memory usage during processing.
+    
+    RSS is polled every tick, but only changes of at least
+    sample_threshold_mb since the last recorded value are kept in
+    memory_samples. Peak, mean and variance are tracked over every tick
+    with running accumulators.
+    
+    The polling interval adapts to the workload: after stable_ticks
+    consecutive ticks moving less than stable_threshold_mb it doubles, up
+    to max_interval, and any larger move resets it to the configured
+    interval. Short bursts between widened polls still count towards the
+    peak when they raise the kernel's peak RSS for the process.
+    """
+    
+    def __init__(self, sample_threshold_mb: float = 10.000003,
+                 stable_threshold_mb: float = 0.5, stable_ticks: int = 8,
+                 max_interval: float = 1.0):
         self.process = psutil.Process()
         self.baseline_memory = 0
         self.peak_memory = 0
-        self.memory_samples = []
-        self.monitoring = False
+        self.memory_samples = SampleRingBuffer()
+        # Slightly off a round number so the threshold doesn't align with
+        # typical allocation sizes
+        self.sample_threshold_mb = sample_threshold_mb
+        self.stable_threshold_mb = stable_threshold_mb
+        self.stable_ticks = stable_ticks
+        self.max_interval = max_interval
+        self._stats = RunningStats()
+        self._stop = threading.Event()
+        self._initial_peak_rss = None
         self.monitor_thread = None
     
-    def start_monitoring(self, sample_interval: float = 0.1):
-        """Start continuous memory monitoring."""
+    def start_monitoring(self, sample_interval: float = 0.1, max_duration: float = 600.0):
+        """
+        Start continuous memory monitoring.
+        
+        Args:
+            sample_interval: Seconds between RSS polls while memory is moving
+            max_duration: Monitoring span the sample buffer is sized for;
+                older samples are overwritten beyond it
+        """
         self.baseline_memory = self.process.memory_info().rss / 1024 / 1024  # MB
         self.peak_memory = self.baseline_memory
-        self.memory_samples = []
-        self.monitoring = True
+        self._initial_peak_rss = _peak_rss_mb()
+        self.memory_samples = SampleRingBuffer(_ring_capacity(sample_interval, max_duration))
+        self._stats = RunningStats()
+        self._stop.clear()
         
         self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(sample_interval,))
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
+        _pin_to_monitor_cpus(self.monitor_thread)
     
     def stop_monitoring(self) -> Dict[str, float]:
         """Stop monitoring and return memory statistics."""
-        self.monitoring = False
+        self._stop.set()
         if self.monitor_thread:
-            self.monitor_thread.join(timeout=1.0)
+            self.monitor_thread.join()
         
         current_memory = self.process.memory_info().rss / 1024 / 1024  # MB
         
-        if self.memory_samples:
-            avg_memory = np.mean(self.memory_samples)
-            memory_variance = np.var(self.memory_samples)
+        # The kernel peak only reflects this run if the run raised it
+        peak_rss = _peak_rss_mb()
+        if peak_rss is not None and peak_rss > self._initial_peak_rss:
+            self.peak_memory = max(self.peak_memory, peak_rss)
+        
+        if self._stats.count:
+            avg_memory = self._stats.mean
+            memory_variance = self._stats.variance
         else:
             avg_memory = current_memory
             memory_variance = 0
@@ -81,48 +289,99 @@ class MemoryProfiler:
     
     def _monitor_loop(self, sample_interval: float):
         """Internal monitoring loop."""
-        while self.monitoring:
+        last_recorded = self.baseline_memory
+        previous_memory = self.baseline_memory
+        
+        # Bound once; the loop does nothing else per tick
+        memory_info = self.process.memory_info
+        stats_add = self._stats.add
+        samples_append = self.memory_samples.append
+        threshold = self.sample_threshold_mb
+        stable_threshold = self.stable_threshold_mb
+        stable_ticks = self.stable_ticks
+        max_interval = max(self.max_interval, sample_interval)
+        stop = self._stop
+        inv_mb = 1.0 / (1024 * 1024)
+        
+        interval = sample_interval
+        stable_count = 0
+        
+        while not stop.is_set():
             try:
-                current_memory = self.process.memory_info().rss / 1024 / 1024  # MB
-                self.memory_samples.append(current_memory)
-                self.peak_memory = max(self.peak_memory, current_memory)
-                time.sleep(sample_interval)
+                current_memory = memory_info().rss * inv_mb
+                if current_memory > self.peak_memory:
+                    self.peak_memory = current_memory
+                
+                # Running mean/variance over every tick
+                stats_add(current_memory)
+                
+                # Only record a sample when the footprint has moved
+                if abs(current_memory - last_recorded) >= threshold:
+                    samples_append(current_memory)
+                    last_recorded = current_memory
+                
+                # Back off while memory is steady, react at once when it moves
+                if abs(current_memory - previous_memory) < stable_threshold:
+                    stable_count += 1
+                    if stable_count >= stable_ticks:
+                        interval = min(interval * 2, max_interval)
+                else:
+                    stable_count = 0
+                    interval = sample_interval
+                previous_memory = current_memory
+                
+                # Returns as soon as monitoring is stopped
+                stop.wait(interval)
             except Exception:
                 break
 
 
 class CPUProfiler:
-    """Tracks CPU usage during processing."""
+    """
+    Tracks CPU usage of this process during processing.
+    
+    Each sample is the process's user + system CPU time over the last
+    interval, as a percentage of the whole machine's capacity. Statistics
+    are accumulated as samples arrive, so stopping costs O(1).
+    """
     
     def __init__(self):
-        self.cpu_samples = []
-        self.monitoring = False
+        self.process = psutil.Process()
+        self.cpu_samples = SampleRingBuffer()
+        self._stats = RunningStats()
+        self._stop = threading.Event()
         self.monitor_thread = None
     
-    def start_monitoring(self, sample_interval: float = 0.1):
-        """Start CPU monitoring."""
-        self.cpu_samples = []
-        self.monitoring = True
+    def start_monitoring(self, sample_interval: float = 0.1, max_duration: float = 600.0):
+        """
+        Start CPU monitoring.
         
-        # Get baseline CPU usage
-        psutil.cpu_percent(interval=None)  # Initialize
+        Args:
+            sample_interval: Seconds between samples
+            max_duration: Monitoring span the sample buffer is sized for;
+                older samples are overwritten beyond it
+        """
+        self.cpu_samples = SampleRingBuffer(_ring_capacity(sample_interval, max_duration))
+        self._stats = RunningStats()
+        self._stop.clear()
         
         self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(sample_interval,))
         self.monitor_thread.daemon = True
         self.monitor_thread.start()
+        _pin_to_monitor_cpus(self.monitor_thread)
     
     def stop_monitoring(self) -> Dict[str, float]:
         """Stop monitoring and return CPU statistics."""
-        self.monitoring = False
+        self._stop.set()
         if self.monitor_thread:
-            self.monitor_thread.join(timeout=1.0)
+            self.monitor_thread.join()
         
-        if self.cpu_samples:
+        if self._stats.count:
             return {
-                'average_percent': np.mean(self.cpu_samples),
-                'peak_percent': np.max(self.cpu_samples),
-                'variance_percent': np.var(self.cpu_samples),
-                'samples_count': len(self.cpu_samples)
+                'average_percent': self._stats.mean,
+                'peak_percent': self._stats.peak,
+                'variance_percent': self._stats.variance,
+                'samples_count': self._stats.count
             }
         else:
             return {
@@ -134,21 +393,179 @@ class CPUProfiler:
     
     def _monitor_loop(self, sample_interval: float):
         """Internal monitoring loop."""
-        while self.monitoring:
+        num_cpus = os.cpu_count() or 1
+        
+        # Baseline CPU time; usage is the delta since the previous tick, so
+        # sampling never blocks and stops as soon as the event is set
+        get_cpu_times = self.process.cpu_times
+        perf_counter = time.perf_counter
+        samples_append = self.cpu_samples.append
+        stats_add = self._stats.add
+        stop_wait = self._stop.wait
+        percent_scale = 100.0 / num_cpus
+        
+        cpu_times = get_cpu_times()
+        prev_cpu = cpu_times.user + cpu_times.system
+        prev_wall = perf_counter()
+        
+        while not stop_wait(sample_interval):
             try:
-                cpu_percent = psutil.cpu_percent(interval=sample_interval)
-                self.cpu_samples.append(cpu_percent)
+                cpu_times = get_cpu_times()
+                cpu = cpu_times.user + cpu_times.system
+                wall = perf_counter()
+                
+                cpu_percent = percent_scale * (cpu - prev_cpu) / (wall - prev_wall)
+                samples_append(cpu_percent)
+                stats_add(cpu_percent)
+                
+                prev_cpu, prev_wall = cpu, wall
             except Exception:
                 break
 
 
+class SignalResourceSampler:
+    """
+    Samples memory and CPU usage of this process from a SIGPROF handler.
+    
+    The profiling timer fires after every sample_interval of CPU time the
+    process uses, so no monitor threads compete with the benchmarked code.
+    A tick costs one getrusage call and one read of /proc/self/statm. The
+    kernel's peak RSS also catches allocations made and freed inside a long
+    C call, during which the Python-level handler can't run.
+    
+    Produces the same statistics as MemoryProfiler and CPUProfiler. Only
+    usable from the main thread on Linux; see available().
+    """
+    
+    STATM_PATH = '/proc/self/statm'
+    
+    def __init__(self):
+        self.memory_samples = SampleRingBuffer()
+        self.cpu_samples = SampleRingBuffer()
+        self._memory_stats = RunningStats()
+        self._cpu_stats = RunningStats()
+        self._page_mb = 0.0
+        self._num_cpus = os.cpu_count() or 1
+        self._statm_fd = None
+        self._previous_handler = None
+        self.baseline_memory = 0
+        self.peak_memory = 0
+        self._initial_peak_rss = 0.0
+        self._prev_cpu = 0.0
+        self._prev_wall = 0.0
+    
+    @classmethod
+    def available(cls) -> bool:
+        """Whether signal sampling can be used from the calling thread."""
+        return (hasattr(signal, 'setitimer')
+                and resource is not None
+                and os.path.exists(cls.STATM_PATH)
+                and threading.current_thread() is threading.main_thread())
+    
+    def start_monitoring(self, sample_interval: float = 0.1, max_duration: float = 600.0):
+        """
+        Start sampling.
+        
+        Args:
+            sample_interval: Seconds of process CPU time between samples
+            max_duration: Monitoring span the sample buffers are sized for;
+                older samples are overwritten beyond it
+        """
+        capacity = _ring_capacity(sample_interval, max_duration)
+        self.memory_samples = SampleRingBuffer(capacity)
+        self.cpu_samples = SampleRingBuffer(capacity)
+        self._memory_stats = RunningStats()
+        self._cpu_stats = RunningStats()
+        
+        self._page_mb = os.sysconf('SC_PAGE_SIZE') / 1024 / 1024
+        self._statm_fd = os.open(self.STATM_PATH, os.O_RDONLY)
+        
+        self.baseline_memory = self._read_rss_mb()
+        self.peak_memory = self.baseline_memory
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        self._initial_peak_rss = usage.ru_maxrss / 1024  # KB on Linux
+        self._prev_cpu = usage.ru_utime + usage.ru_stime
+        self._prev_wall = time.perf_counter()
+        
+        self._previous_handler = signal.signal(signal.SIGPROF, self._handle_tick)
+        # Restart interrupted system calls instead of failing with EINTR
+        signal.siginterrupt(signal.SIGPROF, False)
+        signal.setitimer(signal.ITIMER_PROF, sample_interval, sample_interval)
+    
+    def stop_monitoring(self) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Stop sampling and return (memory statistics, CPU statistics)."""
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler or signal.SIG_DFL)
+        
+        # Close out the span since the last tick
+        current_memory, usage = self._sample()
+        os.close(self._statm_fd)
+        self._statm_fd = None
+        
+        # The kernel peak only reflects this run if the run raised it
+        peak_rss = usage.ru_maxrss / 1024
+        if peak_rss > self._initial_peak_rss:
+            self.peak_memory = max(self.peak_memory, peak_rss)
+        
+        memory_stats = {
+            'baseline_mb': self.baseline_memory,
+            'peak_mb': self.peak_memory,
+            'current_mb': current_memory,
+            'average_mb': self._memory_stats.mean,
+            'variance_mb': self._memory_stats.variance,
+            'peak_increase_mb': self.peak_memory - self.baseline_memory
+        }
+        cpu_stats = {
+            'average_percent': self._cpu_stats.mean,
+            'peak_percent': self._cpu_stats.peak,
+            'variance_percent': self._cpu_stats.variance,
+            'samples_count': self._cpu_stats.count
+        }
+        return memory_stats, cpu_stats
+    
+    def _read_rss_mb(self) -> float:
+        """Current resident set size in MB (second field of statm, in pages)."""
+        return int(os.pread(self._statm_fd, 128, 0).split()[1]) * self._page_mb
+    
+    def _handle_tick(self, signum, frame):
+        """SIGPROF handler."""
+        self._sample()
+    
+    def _sample(self):
+        """Record one memory and CPU sample; returns (RSS in MB, rusage)."""
+        usage = resource.getrusage(resource.RUSAGE_SELF)
+        wall = time.perf_counter()
+        
+        current_memory = self._read_rss_mb()
+        self.peak_memory = max(self.peak_memory, current_memory)
+        self.memory_samples.append(current_memory)
+        self._memory_stats.add(current_memory)
+        
+        cpu = usage.ru_utime + usage.ru_stime
+        if wall > self._prev_wall:
+            cpu_percent = 100.0 * (cpu - self._prev_cpu) / (wall - self._prev_wall) / self._num_cpus
+            self.cpu_samples.append(cpu_percent)
+            self._cpu_stats.add(cpu_percent)
+        self._prev_cpu, self._prev_wall = cpu, wall
+        
+        return current_memory, usage
+
+
 @contextmanager
 def timer():
     """Context manager for precise timing."""
-    start_time = time.perf_counter()
+    start_ns = time.perf_counter_ns()
     yield
-    end_time = time.perf_counter()
-    return end_time - start_time
+    end_ns = time.perf_counter_ns()
+    return (end_ns - start_ns) * 1e-9
+
+
+def _run_benchmark_task(func: Callable, args: Tuple, test_name: str,
+                        lightweight: bool) -> BenchmarkResult:
+    """Benchmark one call in a worker process with its own profilers."""
+    return PerformanceBenchmark().benchmark_function(
+        func, *args, test_name=test_name, lightweight=lightweight
+    )
 
 
 class PerformanceBenchmark:
@@ -157,10 +574,14 @@ class PerformanceBenchmark:
     def __init__(self):
         self.memory_profiler = MemoryProfiler()
         self.cpu_profiler = CPUProfiler()
+        self.signal_sampler = SignalResourceSampler()
         self.results = []
+        # Last observed duration of each function memory-profiled so far
+        self._profile_durations: Dict[Callable, float] = {}
     
     def benchmark_function(self, func: Callable, *args, test_name: str = "benchmark", 
-                          monitor_resources: bool = True, **kwargs) -> BenchmarkResult:
+                          monitor_resources: bool = True, lightweight: bool = False,
+                          **kwargs) -> BenchmarkResult:
         """
         Benchmark a function call with comprehensive metrics.
         
@@ -169,40 +590,66 @@ class PerformanceBenchmark:
             *args: Function arguments
             test_name: Name for this benchmark
             monitor_resources: Whether to monitor CPU/memory
+            lightweight: Only time the call: skips garbage collection and
+                resource monitoring, recording just execution_time/success
             **kwargs: Function keyword arguments
             
         Returns:
             BenchmarkResult with detailed metrics
         """
-        metrics = []
+        values = {}
+        error_message = None
         
-        # Force garbage collection before benchmark
-        gc.collect()
+        if lightweight:
+            monitor_resources = False
+        else:
+            # Collect outstanding garbage before the benchmark if there's
+            # enough of it to matter
+            _collect_garbage_if_needed()
         
-        # Start resource monitoring
-        if monitor_resources:
+        # Start resource monitoring, signal-driven where possible and with
+        # monitor threads otherwise
+        use_signals = monitor_resources and SignalResourceSampler.available()
+        if use_signals:
+            self.signal_sampler.start_monitoring()
+        elif monitor_resources:
             self.memory_profiler.start_monitoring()
             self.cpu_profiler.start_monitoring()
         
-        # Benchmark execution time
-        start_time = time.perf_counter()
+        # Keep the benchmarked call off the CPU the monitor threads use
+        previous_affinity = None
+        if monitor_resources and not use_signals and MONITOR_CPUS is not None:
+            previous_affinity = os.sched_getaffinity(0)
+            if previous_affinity - MONITOR_CPUS:
+                os.sched_setaffinity(0, previous_affinity - MONITOR_CPUS)
+            else:
+                previous_affinity = None
+        
+        # Benchmark execution time (integer nanoseconds until the end)
+        start_ns = time.perf_counter_ns()
         start_timestamp = time.time()
         
-        try:
-            result = func(*args, **kwargs)
-            success = True
-        except Exception as e:
-            result = None
-            success = False
-            metrics.append(PerformanceMetric(
-                "error", 1.0, "bool", f"Execution failed: {str(e)}"
-            ))
+        # Collector pauses would otherwise be billed to the function
+        with _gc_paused():
+            try:
+                result = func(*args, **kwargs)
+                success = True
+            except Exception as e:
+                result = None
+                success = False
+                values[_METRIC_ERROR] = 1.0
+                error_message = str(e)
+            finally:
+                end_ns = time.perf_counter_ns()
+                if previous_affinity is not None:
+                    os.sched_setaffinity(0, previous_affinity)
         
-        end_time = time.perf_counter()
-        execution_time = end_time - start_time
+        execution_time = (end_ns - start_ns) * 1e-9
         
         # Stop resource monitoring
-        if monitor_resources:
+        if use_signals:
+            memory_stats, cpu_stats = self.signal_sampler.stop_monitoring()
+        elif monitor_resources:
             memory_stats = self.memory_profiler.stop_monitoring()
             cpu_stats = self.cpu_profiler.stop_monitoring()
         else:
@@ -210,39 +657,96 @@ class PerformanceBenchmark:
             cpu_stats = {}
         
         # Collect timing metrics
-        metrics.append(PerformanceMetric(
-            "execution_time", execution_time, "seconds", "Total execution time"
-        ))
-        
-        metrics.append(PerformanceMetric(
-            "success", 1.0 if success else 0.0, "bool", "Execution success"
-        ))
+        values[_METRIC_EXECUTION_TIME] = execution_time
+        values[_METRIC_SUCCESS] = 1.0 if success else 0.0
         
         # Collect resource metrics
         if monitor_resources:
             for key, value in memory_stats.items():
-                metrics.append(PerformanceMetric(
-                    f"memory_{key}", value, "MB", f"Memory: {key}"
-                ))
+                values[sys.intern(f"memory_{key}")] = value
             
             for key, value in cpu_stats.items():
-                metrics.append(PerformanceMetric(
-                    f"cpu_{key}", value, "%", f"CPU: {key}"
-                ))
+                values[sys.intern(f"cpu_{key}")] = value
         
         # Create result
         benchmark_result = BenchmarkResult(
             test_name=test_name,
-            metrics=metrics,
+            values=values,
             timestamp=start_timestamp,
-            duration_seconds=execution_time
+            duration_seconds=execution_time,
+            error_message=error_message
+        )
+        
+        self.results.append(benchmark_result)
+        return benchmark_result
+    
+    def benchmark_function_repeated(self, func: Callable, *args, repeats: int = 10,
+                                    test_name: str = "benchmark_repeated",
+                                    **kwargs) -> BenchmarkResult:
+        """
+        Time several back-to-back calls of a function as one measurement.
+        
+        Setup happens once, the garbage collector is paused for the batch and
+        no monitor threads are started, so scaffolding cost doesn't swamp fast functions.
+        
+        Args:
+            func: Function to benchmark
+            *args: Function arguments
+            repeats: Number of consecutive calls inside the timed region
+                (at least 1)
+            test_name: Name for this benchmark
+            **kwargs: Function keyword arguments
+            
+        Returns:
+            BenchmarkResult whose duration_seconds is the average time per
+            call made
+        """
+        if repeats < 1:
+            raise ValueError(f"repeats must be at least 1, got {repeats}")
+        
+        values = {}
+        error_message = None
+        calls = 0
+        
+        _collect_garbage_if_needed()
+        
+        start_ns = time.perf_counter_ns()
+        start_timestamp = time.time()
+        
+        with _gc_paused():
+            try:
+                for _ in range(repeats):
+                    calls += 1
+                    func(*args, **kwargs)
+                success = True
+            except Exception as e:
+                success = False
+                values[_METRIC_ERROR] = 1.0
+                error_message = str(e)
+            finally:
+                end_ns = time.perf_counter_ns()
+        
+        # A failing call ends the batch early, so average over the calls that
+        # actually ran, the failing one included
+        execution_time = (end_ns - start_ns) * 1e-9 / max(calls, 1)
+        
+        values[_METRIC_EXECUTION_TIME] = execution_time
+        values[_METRIC_SUCCESS] = 1.0 if success else 0.0
+        
+        benchmark_result = BenchmarkResult(
+            test_name=test_name,
+            values=values,
+            timestamp=start_timestamp,
+            duration_seconds=execution_time,
+            error_message=error_message
         )
         
         self.results.append(benchmark_result)
         return benchmark_result
     
     def compare_implementations(self, implementations: Dict[str, Callable], 
-                              test_args: List[Tuple], iterations: int = 3) -> Dict[str, any]:
+                              test_args: List[Tuple], iterations: int = 3,
+                              parallel: bool = True) -> Dict[str, any]:
         """
         Compare multiple implementations with the same test cases.
         
@@ -250,6 +754,14 @@ class PerformanceBenchmark:
             implementations: Dict of {name: function} to compare
             test_args: List of argument tuples to test with
             iterations: Number of iterations per test
+            parallel: Run the benchmarks in worker processes, each measuring
+                its own resources. Implementations still run one after
+                another, so they never compete with each other for the CPU,
+                but the runs of one implementation overlap and can slow each
+                other down; use parallel=False for contention-free timings.
+                Falls back to running sequentially in this process when fewer
+                than four CPUs are available or the implementations or
+                arguments can't be pickled.
             
         Returns:
             Comprehensive comparison results
@@ -260,44 +772,96 @@ class PerformanceBenchmark:
             'recommendations': []
         }
         
-        # Run all implementations with all test cases
-        for impl_name, impl_func in implementations.items():
-            impl_results = []
+        # Run all implementations with all test cases. Only the first iteration
+        # of each test is fully monitored; the rest are timed alone.
+        tasks = [
+            (impl_name, impl_func, args,
+             f"{impl_name}_test_{test_idx}_iter_{iteration}", iteration > 0)
+            for impl_name, impl_func in implementations.items()
+            for test_idx, args in enumerate(test_args)
+            for iteration in range(iterations)
+        ]
+        
+        # Workers on half the CPUs, so the overlapping runs (and their monitor
+        # threads) don't oversubscribe the machine
+        workers = (os.cpu_count() or 1) // 2
+        if parallel and workers > 1:
+            try:
+                pickle.dumps((implementations, test_args))
+            except Exception:
+                parallel = False
+        else:
+            parallel = False
+        
+        if parallel:
+            results = []
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                # One implementation at a time; only its own runs overlap
+                for impl_name in implementations:
+                    futures = [
+                        executor.submit(_run_benchmark_task, func, args, test_name, lightweight)
+                        for task_impl, func, args, test_name, lightweight in tasks
+                        if task_impl == impl_name
+                    ]
+                    results.extend(future.result() for future in futures)
+            self.results.extend(results)
+        else:
+            results = [
+                self.benchmark_function(func, *args, test_name=test_name,
+                                        lightweight=lightweight)
+                for _, func, args, test_name, lightweight in tasks
+            ]
+        
+        individual_results = {impl_name: [] for impl_name in implementations}
+        for (impl_name, *_), result in zip(tasks, results):
+            individual_results[impl_name].append(result)
+        comparison_results['individual_results'] = individual_results
+        
+        # Calculate summary statistics for all implementations at once from a
+        # (implementations × runs × [time, memory peak, cpu average, success])
+        # array. Resource metrics only exist for the monitored runs; the
+        # others are NaN and excluded from the resource averages.
+        impl_names = list(individual_results)
+        n_runs = len(test_args) * iterations
+        
+        # Nothing to summarize without implementations or runs
+        if impl_names and n_runs:
+            runs = np.empty((len(impl_names), n_runs, 4), dtype=np.float64)
+            for i, impl_name in enumerate(impl_names):
+                for j, r in enumerate(individual_results[impl_name]):
+                    runs[i, j] = (r.duration_seconds,
+                                  r.values.get(_METRIC_MEMORY_PEAK, np.nan),
+                                  r.values.get(_METRIC_CPU_AVERAGE, np.nan),
+                                  r.values.get(_METRIC_SUCCESS, 0.0))
             
-            for test_idx, args in enumerate(test_args):
-                for iteration in range(iterations):
-                    test_name = f"{impl_name}_test_{test_idx}_iter_{iteration}"
-                    
-                    result = self.benchmark_function(
-                        impl_func, *args, test_name=test_name
-                    )
-                    impl_results.append(result)
+            times = runs[:, :, 0]
+            avg_times = times.mean(axis=1)
+            std_times = times.std(axis=1)
+            min_times = times.min(axis=1)
+            max_times = times.max(axis=1)
             
-            comparison_results['individual_results'][impl_name] = impl_results
-        
-        # Calculate summary statistics
-        for impl_name, results in comparison_results['individual_results'].items():
-            execution_times = [r.duration_seconds for r in results]
-            memory_peaks = [
-                next((m.value for m in r.metrics if m.name == "memory_peak_mb"), 0)
-                for r in results
-            ]
-            cpu_averages = [
-                next((m.value for m in r.metrics if m.name == "cpu_average_percent"), 0)
-                for r in results
-            ]
+            resources = runs[:, :, 1:3]
+            monitored = ~np.isnan(resources)
+            resource_counts = monitored.sum(axis=1)
+            resource_means = np.where(
+                resource_counts > 0,
+                np.where(monitored, resources, 0.0).sum(axis=1) / np.maximum(resource_counts, 1),
+                0.0
+            )
+            success_rates = (runs[:, :, 3] == 1.0).mean(axis=1)
+            
+            for i, impl_name in enumerate(impl_names):
+                comparison_results['summary'][impl_name] = {
+                    'avg_execution_time': float(avg_times[i]),
+                    'std_execution_time': float(std_times[i]),
+                    'min_execution_time': float(min_times[i]),
+                    'max_execution_time': float(max_times[i]),
+                    'avg_memory_peak': float(resource_means[i, 0]),
+                    'avg_cpu_usage': float(resource_means[i, 1]),
+                    'total_tests': runs.shape[1],
+                    'success_rate': float(success_rates[i])
+                }
             
-            comparison_results['summary'][impl_name] = {
-                'avg_execution_time': np.mean(execution_times),
-                'std_execution_time': np.std(execution_times),
-                'min_execution_time': np.min(execution_times),
-                'max_execution_time': np.max(execution_times),
-                'avg_memory_peak': np.mean(memory_peaks),
-                'avg_cpu_usage': np.mean(cpu_averages),
-                'total_tests': len(results),
-                'success_rate': sum(1 for r in results if any(m.name == "success" and m.value == 1.0 for m in r.metrics)) / len(results)
-            }
-        
         # Generate recommendations
         comparison_results['recommendations'] = self._generate_recommendations(
             comparison_results['summary']
@@ -323,9 +887,19 @@ class PerformanceBenchmark:
         iterations = 5
         processing_times = []
         
+        # Warm-up call, also used to batch enough calls per measurement to
+        # span about 100 ms (one call each for slow functions, at most 100)
+        warmup_start_ns = time.perf_counter_ns()
+        try:
+            process_func()
+        except Exception:
+            pass
+        warmup_time = max((time.perf_counter_ns() - warmup_start_ns) * 1e-9, 1e-9)
+        repeats = int(min(100, max(1, 0.1 / warmup_time)))
+        
         for i in range(iterations):
-            result = self.benchmark_function(
-                process_func, test_name=f"realtime_test_{i}"
+            result = self.benchmark_function_repeated(
+                process_func, repeats=repeats, test_name=f"realtime_test_{i}"
             )
             processing_times.append(result.duration_seconds)
         
@@ -357,24 +931,57 @@ class PerformanceBenchmark:
         """
         Detailed memory profiling for a function.
         
+        Functions already seen to finish within two sampling intervals are
+        too fast for the monitor thread to sample, so they are measured with
+        RSS snapshots before and after the call plus the kernel's peak RSS.
+        
         Returns:
             Detailed memory usage statistics
         """
-        # Get initial memory state
-        gc.collect()
-        initial_memory = self.memory_profiler.process.memory_info().rss / 1024 / 1024
+        sample_interval = 0.01  # High frequency
+        _collect_garbage_if_needed()
         
-        # Run with detailed monitoring
-        self.memory_profiler.start_monitoring(sample_interval=0.01)  # High frequency
+        previous_duration = self._profile_durations.get(func)
+        fast_path = (previous_duration is not None
+                     and previous_duration < 2 * sample_interval
+                     and resource is not None)
         
+        if fast_path:
+            initial_memory = self.memory_profiler.process.memory_info().rss / 1024 / 1024
+            initial_peak = _peak_rss_mb()
+        else:
+            # Run with detailed monitoring; the monitor's baseline reading is
+            # the initial memory state
+            self.memory_profiler.start_monitoring(sample_interval=sample_interval)
+            initial_memory = self.memory_profiler.baseline_memory
+        
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
             success = True
         except Exception as e:
             result = None
             success = False
+        self._profile_durations[func] = time.perf_counter() - start_time
         
-        memory_stats = self.memory_profiler.stop_monitoring()
+        if fast_path:
+            current_memory = self.memory_profiler.process.memory_info().rss / 1024 / 1024
+            # The kernel peak only reflects this call if the call raised it
+            peak_memory = max(initial_memory, current_memory)
+            final_peak = _peak_rss_mb()
+            if final_peak > initial_peak:
+                peak_memory = max(peak_memory, final_peak)
+            
+            memory_stats = {
+                'baseline_mb': initial_memory,
+                'peak_mb': peak_memory,
+                'current_mb': current_memory,
+                'average_mb': (initial_memory + current_memory) / 2,
+                'variance_mb': 0,
+                'peak_increase_mb': peak_memory - initial_memory
+            }
+        else:
+            memory_stats = self.memory_profiler.stop_monitoring()
         
         # Force cleanup and measure final state
         del result
@@ -400,26 +1007,37 @@ class PerformanceBenchmark:
         if not summary:
             return ["No benchmark data available for recommendations"]
         
-        # Find fastest implementation
-        fastest_impl = min(summary.keys(), 
-                          key=lambda k: summary[k]['avg_execution_time'])
+        # Find the fastest, most memory efficient and most reliable
+        # implementations and the memory-heavy ones in one pass; ties go to
+        # the first implementation, as with min()/max()
+        fastest_impl = memory_efficient = most_reliable = None
+        memory_warnings = []
+        for impl_name, stats in summary.items():
+            execution_time = stats['avg_execution_time']
+            memory_peak = stats['avg_memory_peak']
+            success_rate = stats['success_rate']
+            
+            if fastest_impl is None:
+                fastest_impl = memory_efficient = most_reliable = impl_name
+                fastest_time = execution_time
+                lowest_memory = memory_peak
+                best_success_rate = success_rate
+            else:
+                if execution_time < fastest_time:
+                    fastest_impl, fastest_time = impl_name, execution_time
+                if memory_peak < lowest_memory:
+                    memory_efficient, lowest_memory = impl_name, memory_peak
+                if success_rate > best_success_rate:
+                    most_reliable, best_success_rate = impl_name, success_rate
+            
+            if memory_peak > 100:  # > 100MB
+                memory_warnings.append(f"{impl_name} uses significant memory ({memory_peak:.1f} MB)")
         
         recommendations.append(f"Fastest implementation: {fastest_impl}")
-        
-        # Find most memory efficient
-        memory_efficient = min(summary.keys(),
-                             key=lambda k: summary[k]['avg_memory_peak'])
-        
         recommendations.append(f"Most memory efficient: {memory_efficient}")
-        
-        # Find most reliable
-        most_reliable = max(summary.keys(),
-                           key=lambda k: summary[k]['success_rate'])
-        
         recommendations.append(f"Most reliable: {most_reliable}")
         
-        # Performance analysis
-        fastest_time = summary[fastest_impl]['avg_execution_time']
+        # Performance analysis (needs the fastest time, so a second pass)
         for impl_name, stats in summary.items():
             if impl_name != fastest_impl:
                 slowdown = stats['avg_execution_time'] / fastest_time
@@ -427,44 +1045,46 @@ class PerformanceBenchmark:
                     recommendations.append(f"{impl_name} is {slowdown:.1f}x slower than {fastest_impl}")
         
         # Memory analysis
-        for impl_name, stats in summary.items():
-            if stats['avg_memory_peak'] > 100:  # > 100MB
-                recommendations.append(f"{impl_name} uses significant memory ({stats['avg_memory_peak']:.1f} MB)")
+        recommendations.extend(memory_warnings)
         
         return recommendations
     
     def export_results(self, filename: str) -> bool:
-        """Export benchmark results to JSON file."""
+        """
+        Export benchmark results to JSON file.
+        
+        Results are serialized and written one at a time through a large
+        write buffer, so the full export is never built in memory.
+        """
         import json
         
         try:
-            export_data = {
-                'benchmark_results': [],
-                'summary': {},
-                'timestamp': time.time()
-            }
+            export_timestamp = time.time()
             
-            # Convert results to serializable format
-            for result in self.results:
-                result_data = {
-                    'test_name': result.test_name,
-                    'timestamp': result.timestamp,
-                    'duration_seconds': result.duration_seconds,
-                    'metrics': {}
-                }
+            with open(filename, 'w', buffering=1 << 20) as f:
+                f.write('{"benchmark_results": [')
                 
-                for metric in result.metrics:
-                    result_data['metrics'][metric.name] = {
-                        'value': metric.value,
-                        'unit': metric.unit,
-                        'description': metric.description
+                # Convert results to serializable format
+                for index, result in enumerate(self.results):
+                    result_data = {
+                        'test_name': result.test_name,
+                        'timestamp': result.timestamp,
+                        'duration_seconds': result.duration_seconds,
+                        'metrics': {}
                     }
+                    
+                    for name, value in result.values.items():
+                        unit, description = describe_metric(name, result.error_message)
+                        result_data['metrics'][name] = {
+                            'value': value,
+                            'unit': unit,
+                            'description': description
+                        }
+                    
+                    f.write(',\n' if index else '\n')
+                    json.dump(result_data, f)
                 
-                export_data['benchmark_results'].append(result_data)
-            
-            # Write to file
-            with open(filename, 'w') as f:
-                json.dump(export_data, f, indent=2)
+                f.write(f'\n], "summary": {{}}, "timestamp": {json.dumps(export_timestamp)}}}\n')
             
             return True
             
@@ -101,6 +101,18 @@ def test_frame_segmentation():
         else:
             print("⚠ Reconstruction quality may need improvement")
         
+        # Block segmentation must give the same frames (zero-padded) and infos
+        frames_block, block_infos = segmenter.segment_audio_block(mono_audio)
+        if [vars(info) for info in block_infos] != [vars(info) for _, info in frames]:
+            print("✗ Block segmentation frame infos differ")
+            return False
+        for (frame, info), block_frame in zip(frames, frames_block):
+            if (not np.array_equal(block_frame[:info.actual_size], frame[:info.actual_size])
+                    or np.any(block_frame[info.actual_size:])):
+                print(f"✗ Block segmentation frame {info.index} differs")
+                return False
+        print(f"✓ Block segmentation matches: {frames_block.shape}")
+        
         return True
         
     except Exception as e:
@@ -142,9 +154,24 @@ def test_quality_metrics():
         overall_score = metrics.get('overall_score', 0)
         print(f"  Overall quality score: {overall_score:.1f}/100")
         
+        # In-memory comparison must match the file comparison it backs
+        file3 = os.path.join(test_dir, "test3.wav")
+        sf.write(file3, audio * 0.5, sample_rate)  # Quieter copy
+        file_metrics = analyzer.compare_audio_files(file1, file3)
+        ref_audio, _ = sf.read(file1, dtype='float32')
+        test_audio, _ = sf.read(file3, dtype='float32')
+        array_metrics = analyzer.compare_audio_arrays(ref_audio, test_audio, sample_rate)
+        if (array_metrics.keys() != file_metrics.keys() or
+                not all(np.isclose(array_metrics[k], file_metrics[k], equal_nan=True)
+                        for k in file_metrics)):
+            print("✗ Array comparison differs from file comparison")
+            return False
+        print(f"✓ Array comparison matches file comparison ({len(array_metrics)} metrics)")
+        
         # Cleanup
         os.remove(file1)
         os.remove(file2)
+        os.remove(file3)
         os.rmdir(test_dir)
         
         return True
@@ -158,7 +185,7 @@ def test_performance_benchmarks():
     print("\nTesting performance benchmarks...")
     
     try:
-        from performance_benchmarks import PerformanceBenchmark
+        from performance_benchmarks import PerformanceBenchmark, SignalResourceSampler
         
         # Simple function to benchmark
         def test_function(duration):
@@ -187,12 +214,77 @@ def test_performance_benchmarks():
         else:
             print(f"⚠ Timing accuracy: {timing_error*1000:.1f}ms error")
         
+        # Comparing no implementations gives an empty summary, not an error
+        comparison = benchmark.compare_implementations({}, [(0.1,)], iterations=3)
+        if comparison['summary'] or comparison['recommendations'] != [
+            "No benchmark data available for recommendations"
+        ]:
+            print("✗ Empty implementation comparison returned unexpected results")
+            return False
+        print("✓ Empty implementation comparison handled")
+        
+        # Signal-driven sampler reports stats around a short busy loop
+        if SignalResourceSampler.available():
+            sampler = SignalResourceSampler()
+            sampler.start_monitoring(sample_interval=0.01)
+            total = 0
+            for i in range(2_000_000):
+                total += i
+            memory_stats, cpu_stats = sampler.stop_monitoring()
+            if ('peak_mb' not in memory_stats or 'average_percent' not in cpu_stats or
+                    cpu_stats.get('samples_count', 0) < 1):
+                print(f"✗ Signal sampler returned incomplete stats: {memory_stats}, {cpu_stats}")
+                return False
+            print(f"✓ Signal sampler collected {cpu_stats['samples_count']} samples")
+        else:
+            print("⚠ Signal sampler not available on this platform, skipped")
+        
         return True
         
     except Exception as e:
         print(f"✗ Performance benchmark test failed: {e}")
         return False
 
+def test_limiter_batch_equivalence():
+    """Test that batch limiting matches frame-by-frame limiting."""
+    print("\nTesting limiter batch/frame equivalence...")
+    
+    try:
+        from frame_aware_limiter import FrameAwareLimiterProcessor
+        
+        # Loud stereo audio so the limiter engages, ending in a short frame
+        frame_size = 4096
+        rng = np.random.default_rng(0)
+        audio = (rng.standard_normal((8 * frame_size + 1000, 2)) * 0.8).astype(np.float32)
+        
+        frame_processor = FrameAwareLimiterProcessor(sample_rate=44100, frame_size=frame_size)
+        frame_processor.initialize_limiter()
+        frame_output = np.concatenate([
+            frame_processor.process_audio_frame(audio[start:start + frame_size], gain_adjust_db=3.0)
+            for start in range(0, len(audio), frame_size)
+        ])
+        
+        batch_processor = FrameAwareLimiterProcessor(sample_rate=44100, frame_size=frame_size)
+        batch_processor.initialize_limiter()
+        batch_output = batch_processor.process_audio_batch(audio, gain_adjust_db=3.0)
+        
+        if frame_output.shape != audio.shape or batch_output.shape != audio.shape:
+            print(f"✗ Output shapes differ: frames {frame_output.shape}, "
+                  f"batch {batch_output.shape}, input {audio.shape}")
+            return False
+        
+        max_difference = np.max(np.abs(frame_output - batch_output))
+        if max_difference > 1e-6:
+            print(f"✗ Batch output differs from frame output by {max_difference:.2e}")
+            return False
+        
+        print(f"✓ Batch output matches frame output ({len(audio)} samples, short final frame)")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Limiter equivalence test failed: {e}")
+        return False
+
 def main():
     """Run basic validation tests."""
     print("Frame Processing Framework - Basic Validation Tests")
@@ -202,7 +294,8 @@ def main():
         ("Import Test", test_basic_imports),
         ("Frame Segmentation Test", test_frame_segmentation),
         ("Quality Metrics Test", test_quality_metrics),
-        ("Performance Benchmark Test", test_performance_benchmarks)
+        ("Performance Benchmark Test", test_performance_benchmarks),
+        ("Limiter Batch Equivalence Test", test_limiter_batch_equivalence)
     ]
     
     passed = 0
@@ -10,9 +10,9 @@ import os
 import sys
 import numpy as np
 import soundfile as sf
-import matplotlib.pyplot as plt
 import time
 from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import json
 
 # Add project paths
@@ -39,10 +39,19 @@ except ImportError as e:
 class LimiterComparisonTest:
     """Comprehensive testing suite for frame-aware limiter."""
     
-    def __init__(self, output_dir: str = "limiter_test_results"):
+    def __init__(self, output_dir: str = "limiter_test_results", save_wavs: bool = True):
         self.output_dir = output_dir
         os.makedirs(output_dir, exist_ok=True)
+        # Whether test inputs and limiter outputs are saved as WAV files;
+        # quality analysis works on the in-memory results either way
+        self.save_wavs = save_wavs
+        # WAV files are written in the background (soundfile releases the GIL
+        # while encoding), overlapping disk I/O with the next test
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        self._pending_writes = []
         self.quality_analyzer = AudioQualityAnalyzer()
+        # Fixed seed, so noise test signals are the same on every run
+        self._rng = np.random.default_rng(0)
         
         # Test configurations
         self.test_configs = {
@@ -63,14 +72,18 @@ class LimiterComparisonTest:
     
     def _generate_sine_wave(self, duration: float = 3.0, sample_rate: int = 44100) -> np.ndarray:
         """Generate test sine wave with varying amplitude."""
-        t = np.linspace(0, duration, int(duration * sample_rate), False)
+        t = self._sample_times(duration, sample_rate)
         
         # Sine wave with envelope
         base_freq = 440  # A4
-        signal = np.sin(2 * np.pi * base_freq * t)
+        signal = np.empty(len(t), dtype=np.float32)
+        np.sin((2 * np.pi * base_freq) * t, out=signal)
         
         # Add amplitude modulation to test limiter response
-        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 0.5 * t)  # 0.5 Hz modulation
+        envelope = np.empty(len(t), dtype=np.float32)
+        np.sin((2 * np.pi * 0.5) * t, out=envelope)  # 0.5 Hz modulation
+        envelope *= 0.5
+        envelope += 0.5
         signal *= envelope
         
         # Scale to cause limiting (peak at 1.5)
@@ -81,84 +94,149 @@ class LimiterComparisonTest:
     
     def _generate_complex_music(self, duration: float = 3.0, sample_rate: int = 44100) -> np.ndarray:
         """Generate complex musical content to test limiter musicality."""
-        t = np.linspace(0, duration, int(duration * sample_rate), False)
+        t = self._sample_times(duration, sample_rate)
         
         # Multiple harmonically related frequencies
         frequencies = [220, 440, 660, 880, 1100]  # Musical intervals
         amplitudes = [0.4, 0.3, 0.2, 0.15, 0.1]
         
-        signal = np.zeros_like(t)
+        # Add vibrato and tremolo for realism. Both modulations are shared by
+        # every harmonic: the vibrato as a phase that each harmonic scales by
+        # its frequency, the tremolo as a gain applied once to the sum
+        two_pi_t = 2 * np.pi * t
+        vibrato_phase = two_pi_t * (1 + 0.02 * np.sin(5 * two_pi_t))
+        tremolo = (1 + 0.1 * np.sin(3 * two_pi_t)).astype(np.float32)
+        
+        signal = np.zeros(len(t), dtype=np.float32)
+        harmonic = np.empty(len(t), dtype=np.float32)
         for freq, amp in zip(frequencies, amplitudes):
-            # Add vibrato and tremolo for realism
-            vibrato = freq * (1 + 0.02 * np.sin(2 * np.pi * 5 * t))
-            tremolo = amp * (1 + 0.1 * np.sin(2 * np.pi * 3 * t))
-            signal += tremolo * np.sin(2 * np.pi * vibrato * t)
+            np.sin(freq * vibrato_phase, out=harmonic)
+            harmonic *= amp
+            signal += harmonic
+        signal *= tremolo
         
         # Add some percussive transients
         transient_times = np.arange(0.5, duration, 0.8)
-        for transient_time in transient_times:
-            transient_start = int(transient_time * sample_rate)
-            transient_end = min(transient_start + int(0.01 * sample_rate), len(signal))
-            signal[transient_start:transient_end] += 0.8 * np.exp(-50 * (t[transient_start:transient_end] - transient_time))
+        self._add_transients(signal, transient_times, 0.01, 50, 0.8, sample_rate)
         
         # Scale to cause limiting
         signal *= 1.2
         
         # Convert to stereo with slight delay for width
         left = signal
-        right = np.concatenate([np.zeros(int(0.001 * sample_rate)), signal[:-int(0.001 * sample_rate)]])
+        right = np.concatenate([np.zeros(int(0.001 * sample_rate), dtype=signal.dtype),
+                                signal[:-int(0.001 * sample_rate)]])
         
         return np.column_stack([left, right])
     
     def _generate_transient_rich(self, duration: float = 3.0, sample_rate: int = 44100) -> np.ndarray:
         """Generate signal with sharp transients to test attack response."""
-        t = np.linspace(0, duration, int(duration * sample_rate), False)
+        t = self._sample_times(duration, sample_rate)
         
         # Base drone
-        signal = 0.2 * np.sin(2 * np.pi * 80 * t)  # Low drone
+        signal = np.empty(len(t), dtype=np.float32)
+        np.sin((2 * np.pi * 80) * t, out=signal)  # Low drone
+        signal *= 0.2
         
         # Add sharp transients every 0.2 seconds
         transient_interval = 0.2
         transient_times = np.arange(0.1, duration, transient_interval)
         
-        for transient_time in transient_times:
-            start_idx = int(transient_time * sample_rate)
-            if start_idx < len(signal):
-                # Sharp attack, exponential decay
-                decay_samples = int(0.05 * sample_rate)  # 50ms decay
-                end_idx = min(start_idx + decay_samples, len(signal))
-                
-                decay_envelope = np.exp(-20 * (t[start_idx:end_idx] - transient_time))
-                signal[start_idx:end_idx] += 1.5 * decay_envelope
+        # Sharp attack, exponential decay over 50ms
+        self._add_transients(signal, transient_times, 0.05, 20, 1.5, sample_rate)
         
         # Convert to stereo
         return np.column_stack([signal, signal])
     
+    def _sample_times(self, duration: float, sample_rate: int) -> np.ndarray:
+        """
+        Sample times in seconds for a test signal.
+        
+        Kept in float64 so sine phases several thousand radians in stay
+        accurate; the generated signals themselves are float32.
+        """
+        return np.arange(int(duration * sample_rate)) * (1.0 / sample_rate)
+    
+    def _add_transients(self, signal: np.ndarray, transient_times: np.ndarray,
+                        length_s: float, decay_rate: float, gain: float,
+                        sample_rate: int):
+        """
+        Add exponentially decaying transients to signal in place.
+        
+        Each transient is gain * exp(-decay_rate * (t - transient_time)) for
+        length_s seconds from the sample at transient_time, cut off at the end
+        of the signal. All transients are added in one scattered add.
+        """
+        starts = (transient_times * sample_rate).astype(int)
+        offsets = np.arange(int(length_s * sample_rate))
+        
+        # One decay curve shared by every transient, each scaled for the
+        # fraction of a sample between its start index and its exact time
+        decay_template = np.exp(-decay_rate * offsets / sample_rate)
+        start_gains = gain * np.exp(-decay_rate * (starts / sample_rate - transient_times))
+        
+        # Values in the signal's own dtype, as np.add.at is far slower when
+        # it has to cast
+        indices = starts[:, None] + offsets
+        in_range = indices < len(signal)
+        transients = (start_gains[:, None] * decay_template).astype(signal.dtype, copy=False)
+        np.add.at(signal, indices[in_range], transients[in_range])
+    
     def _generate_pink_noise(self, duration: float = 3.0, sample_rate: int = 44100) -> np.ndarray:
         """Generate pink noise for realistic broadband testing."""
         samples = int(duration * sample_rate)
         
-        # Generate white noise
-        white_noise = np.random.randn(samples)
-        
-        # Apply 1/f filter for pink noise approximation
-        # Simple first-order IIR filter
-        pink_noise = np.zeros_like(white_noise)
-        pink_noise[0] = white_noise[0]
+        # Generate white noise, twice as long as needed so the filter's
+        # circular wrap-around lands in the half that is thrown away
+        white_noise = self._rng.standard_normal(2 * samples, dtype=np.float32)
         
-        for i in range(1, len(white_noise)):
-            pink_noise[i] = 0.99 * pink_noise[i-1] + 0.1 * white_noise[i]
+        # Apply 1/f filter in the frequency domain: scaling magnitudes by
+        # 1/sqrt(f) gives power falling at 3 dB/octave (DC gets the gain of
+        # the lowest non-zero bin)
+        spectrum = np.fft.rfft(white_noise)
+        freqs = np.fft.rfftfreq(len(white_noise))
+        freqs[0] = freqs[1]
+        spectrum *= (1 / np.sqrt(freqs)).astype(np.float32)
+        pink_noise = np.fft.irfft(spectrum, n=len(white_noise))[:samples]
+        pink_noise = pink_noise.astype(np.float32, copy=False)  # numpy < 2 transforms in float64
         
         # Normalize and scale
-        pink_noise = pink_noise / np.std(pink_noise) * 0.8
+        pink_noise *= 0.8 / np.std(pink_noise)
         
         # Convert to stereo
         return np.column_stack([pink_noise, pink_noise])
     
+    def _write_wav(self, path: str, audio: np.ndarray, sample_rate: int):
+        """
+        Queue a WAV file write on the background I/O threads.
+        
+        The audio array must not be modified afterwards; wait_for_writes()
+        blocks until every queued file is on disk.
+        """
+        self._pending_writes.append(
+            (path, self._io_pool.submit(sf.write, path, audio, sample_rate))
+        )
+    
+    def wait_for_writes(self):
+        """Wait for all queued WAV writes, reporting any that failed."""
+        for path, future in self._pending_writes:
+            try:
+                future.result()
+            except Exception as e:
+                print(f"⚠ Failed to write {path}: {e}")
+        self._pending_writes = []
+    
     def test_single_configuration(self, config_name: str, config_params: Dict,
                                  signal_name: str, audio_signal: np.ndarray,
-                                 sample_rate: int = 44100) -> Dict:
-        """Test single limiter configuration against original."""
+                                 sample_rate: int = 44100, write_input: bool = True) -> Dict:
+        """
+        Test single limiter configuration against original.
+        
+        write_input=False skips saving input_{signal_name}.wav, for callers
+        that already wrote it once for all configurations. WAV files are
+        written in the background; call wait_for_writes() before reading
+        them.
+        """
         print(f"\\nTesting {config_name} config with {signal_name} signal...")
         
         results = {
@@ -175,7 +253,8 @@ class LimiterComparisonTest:
         input_file = os.path.join(self.output_dir, f"input_{signal_name}.wav")
         
         # Save input for reference
-        sf.write(input_file, audio_signal, sample_rate)
+        if write_input and self.save_wavs:
+            self._write_wav(input_file, audio_signal, sample_rate)
         
         # Test original limiter (if available)
         original_time = float('inf')
@@ -192,24 +271,27 @@ class LimiterComparisonTest:
                 if 'release_ms' in config_params:
                     config.release = config_params['release_ms']
                 
-                # Apply original limiter
-                original_result = limit(audio_signal, config)
+                # Apply original limiter. Matchering works in double precision,
+                # so the float32 test signal is upcast here only; the frame
+                # limiter stays float32.
+                reference_audio = limit(audio_signal.astype(np.float64), config)
                 original_time = time.time() - start_time
-                
-                # Save result
-                sf.write(original_limited, original_result, sample_rate)
                 print(f"  ✓ Original limiter: {original_time:.4f}s")
                 
             except Exception as e:
                 print(f"  ✗ Original limiter failed: {e}")
-                # Create dummy file
-                sf.write(original_limited, audio_signal * 0.8, sample_rate)
+                # Dummy reference
+                reference_audio = audio_signal * 0.8
                 original_time = float('inf')
         else:
             # Create dummy reference (just scaled down)
-            sf.write(original_limited, audio_signal * 0.8, sample_rate)
+            reference_audio = audio_signal * 0.8
             print("  ⚠ Original limiter not available, using scaled reference")
         
+        # Save result
+        if self.save_wavs:
+            self._write_wav(original_limited, reference_audio, sample_rate)
+        
         # Test frame-aware limiter
         try:
             start_time = time.time()
@@ -218,23 +300,28 @@ class LimiterComparisonTest:
             processor = FrameAwareLimiterProcessor(sample_rate=sample_rate, frame_size=4096)
             processor.initialize_limiter(config_params)
             
-            # Process in frames
+            # Process in frames, writing each result straight into one output
+            # buffer; every frame, including a short last one, returns as
+            # many samples as it was given
             frame_size = 4096
-            frame_result = []
+            frame_limited_audio = None
             
             for start_idx in range(0, len(audio_signal), frame_size):
                 end_idx = min(start_idx + frame_size, len(audio_signal))
                 frame = audio_signal[start_idx:end_idx]
                 
                 processed_frame = processor.process_audio_frame(frame, enable_limiter=True)
-                frame_result.append(processed_frame)
-            
-            # Concatenate results
-            frame_limited_audio = np.vstack(frame_result)
+                if frame_limited_audio is None:
+                    frame_limited_audio = np.empty(
+                        (len(audio_signal),) + processed_frame.shape[1:],
+                        dtype=processed_frame.dtype
+                    )
+                frame_limited_audio[start_idx:end_idx] = processed_frame
             frame_time = time.time() - start_time
             
             # Save result
-            sf.write(frame_limited, frame_limited_audio, sample_rate)
+            if self.save_wavs:
+                self._write_wav(frame_limited, frame_limited_audio, sample_rate)
             print(f"  ✓ Frame limiter: {frame_time:.4f}s")
             
             # Get processing info
@@ -245,14 +332,15 @@ class LimiterComparisonTest:
             print(f"  ✗ Frame limiter failed: {e}")
             results['processing_success'] = False
             # Create dummy file
-            sf.write(frame_limited, audio_signal * 0.8, sample_rate)
+            if self.save_wavs:
+                self._write_wav(frame_limited, audio_signal * 0.8, sample_rate)
             frame_time = float('inf')
         
         # Quality comparison
         if results['processing_success']:
             try:
-                quality_metrics = self.quality_analyzer.compare_audio_files(
-                    original_limited, frame_limited
+                quality_metrics = self.quality_analyzer.compare_audio_arrays(
+                    reference_audio, frame_limited_audio, sample_rate
                 )
                 results['quality_metrics'] = quality_metrics
                 print(f"  Quality score: {quality_metrics.get('overall_score', 'unknown'):.1f}/100")
@@ -273,24 +361,55 @@ class LimiterComparisonTest:
         
         return results
     
-    def run_comprehensive_tests(self) -> List[Dict]:
-        """Run comprehensive limiter comparison tests."""
-        all_results = []
-        
+    def run_comprehensive_tests(self, parallel: bool = True) -> List[Dict]:
+        """
+        Run comprehensive limiter comparison tests.
+        
+        Args:
+            parallel: Run the signal × configuration matrix in worker
+                processes, one test per task. Tests then overlap, so their
+                timings (and real-time factors) can be slowed by each other;
+                use parallel=False for contention-free timings. Falls back to
+                running sequentially in this process when fewer than four
+                CPUs are available.
+                
+        Returns:
+            Test results in signal, then configuration order
+        """
         print("🔧 Frame-Aware Limiter Comprehensive Testing")
         print("=" * 60)
         
+        tasks = []
         for signal_name, signal_generator in self.test_signals:
             print(f"\\n📊 Generating {signal_name} test signal...")
             audio_signal = signal_generator()
             
+            # Save input for reference once, rather than once per configuration
+            if self.save_wavs:
+                self._write_wav(os.path.join(self.output_dir, f"input_{signal_name}.wav"), audio_signal, 44100)
+            
             for config_name, config_params in self.test_configs.items():
-                result = self.test_single_configuration(
-                    config_name, config_params, signal_name, audio_signal
-                )
-                all_results.append(result)
+                tasks.append((config_name, config_params, signal_name, audio_signal))
+        
+        # Workers on half the CPUs, so the overlapping tests don't
+        # oversubscribe the machine
+        workers = (os.cpu_count() or 1) // 2
+        if parallel and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_run_configuration_task, self.output_dir, self.save_wavs, *task)
+                    for task in tasks
+                ]
+                results = [future.result() for future in futures]
+        else:
+            results = [
+                self.test_single_configuration(*task, write_input=False)
+                for task in tasks
+            ]
         
-        return all_results
+        # Every WAV file is on disk once the tests return
+        self.wait_for_writes()
+        return results
     
     def generate_report(self, results: List[Dict]) -> str:
         """Generate comprehensive test report."""
@@ -339,6 +458,13 @@ class LimiterComparisonTest:
     def create_visualization(self, results: List[Dict]) -> str:
         """Create visualization of test results."""
         try:
+            # Imported on first use, so test runs that never plot don't pay
+            # for it. Plots are only saved to file, so the non-interactive
+            # Agg backend skips any GUI toolkit setup
+            import matplotlib
+            matplotlib.use('Agg')
+            import matplotlib.pyplot as plt
+            
             # Extract data for plotting
             configs = []
             signals = []
@@ -385,6 +511,18 @@ class LimiterComparisonTest:
             return ""
 
 
+def _run_configuration_task(output_dir: str, save_wavs: bool, config_name: str,
+                            config_params: Dict, signal_name: str,
+                            audio_signal: np.ndarray) -> Dict:
+    """Run one test_single_configuration call in a worker process."""
+    tester = LimiterComparisonTest(output_dir, save_wavs=save_wavs)
+    result = tester.test_single_configuration(
+        config_name, config_params, signal_name, audio_signal, write_input=False
+    )
+    tester.wait_for_writes()
+    return result
+
+
 def main():
     """Run frame-aware limiter tests."""
     tester = LimiterComparisonTest()